@@ -1,6 +1,6 @@
 # type: ignore
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable, Optional
 from PyQt6.QtWidgets import QWidget
 from models.base_model import BaseModel
 
@@ -12,17 +12,32 @@ class BaseController(ABC):
     handling communication and data flow between them.
     """
     
-    def __init__(self, model: BaseModel, view: QWidget) -> None:
+    # Scale of the quick preview rendered before the full-resolution result;
+    # 1.0 disables the preview for processors that are cheap or scale-dependent
+    PREVIEW_SCALE = 1.0
+    
+    def __init__(self, model: BaseModel, view_factory: Callable[[], QWidget]) -> None:
         """
-        Initialize the controller with model and view.
+        Initialize the controller with model and view factory.
+        
+        The view is built on first access, so processors the user never
+        selects cost no widget construction.
         
         Args:
             model (BaseModel): The processor model instance
-            view (QWidget): The processor view instance
+            view_factory (Callable[[], QWidget]): Callable creating the processor view
         """
         self.model = model
-        self.view = view
-        self._connect_signals()
+        self._view_factory = view_factory
+        self._view: Optional[QWidget] = None
+    
+    @property
+    def view(self) -> QWidget:
+        """Get the processor view, creating it and connecting its signals on first use."""
+        if self._view is None:
+            self._view = self._view_factory()
+            self._connect_signals()
+        return self._view
 
     def _connect_signals(self) -> None:
         """
@@ -43,6 +58,11 @@ class BaseController(ABC):
         """
         return self.model
 
+    @property
+    def preview_scale(self) -> float:
+        """Get the scale at which a quick preview result is rendered."""
+        return self.PREVIEW_SCALE
+
     def get_view(self) -> QWidget:
         """
         Get the controller's view instance.
@@ -59,9 +79,11 @@ class BaseController(ABC):
         This method should be called before the controller is destroyed
         to properly disconnect signals and free resources.
         """
-        try:
-            if hasattr(self.view, "parameters_changed"):
-                self.view.parameters_changed.disconnect()
-        except RuntimeError:
-            # Signal already disconnected
-            pass 
\ No newline at end of file
+        if self._view is None:
+            # The view was never created, so nothing was connected
+            return
+        # The view's own cleanup may already have dropped every connection,
+        # and disconnect() raises when nothing is connected
+        if (hasattr(self.view, "parameters_changed") and
+                self.view.receivers(self.view.parameters_changed) > 0):
+            self.view.parameters_changed.disconnect() 
\ No newline at end of file
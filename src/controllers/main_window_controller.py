@@ -66,18 +66,20 @@ class MainWindowController:
         processor_names = self.model.get_processor_names()
         self.view.set_processor_names(processor_names)
         
-        # Setup processor views
-        processor_views = {}
-        for name in self.model.processor_controllers.keys():
-            processor_views[name] = self.model.get_processor_view(name)
+        # Setup processor views; each is built the first time it is selected
+        processor_view_factories = {}
+        for name, controller in self.model.processor_controllers.items():
+            processor_view_factories[name] = controller.get_view
         
-        self.view.setup_processor_views(processor_views)
+        self.view.setup_processor_views(processor_view_factories)
         
         # Initial button states
         self.view.set_save_button_enabled(False)
     
     def _connect_signals(self) -> None:
         """Connect signals between model and view."""
+        # Always connect bound signals to callables; never use string-based
+        # SIGNAL()/SLOT() signatures, which need runtime normalization
         # Connect view signals to controller methods
         self.view.upload_requested.connect(self._on_upload_requested)
         self.view.processor_selection_changed.connect(self._on_processor_selection_changed)
@@ -87,14 +89,18 @@ class MainWindowController:
         
         # Connect model signals to view updates
         self.model.image_loaded.connect(self._on_image_loaded)
+        self.model.loading_started.connect(self._on_loading_started)
+        self.model.loading_finished.connect(self._on_loading_finished)
         self.model.image_processed.connect(self._on_image_processed)
+        self.model.preview_ready.connect(self._on_preview_ready)
         self.model.processor_changed.connect(self._on_processor_changed)
         self.model.processing_started.connect(self._on_processing_started)
         self.model.processing_finished.connect(self._on_processing_finished)
+        self.model.processing_succeeded.connect(self._on_processing_succeeded)
+        self.model.saving_started.connect(self._on_saving_started)
+        self.model.saving_finished.connect(self._on_saving_finished)
+        self.model.image_saved.connect(self._on_image_saved)
         self.model.error_occurred.connect(self._on_error_occurred)
-        
-        # Connect window resize to image refresh
-        self.view.resizeEvent = self._on_window_resized
     
     # View event handlers
     
@@ -106,15 +112,8 @@ class MainWindowController:
             file_path: Path to file to upload
         """
         self.logger.info(f"Upload requested: {file_path}")
-        success = self.model.load_image(file_path)
-        
-        if success:
-            self.view.show_success_message("Image loaded successfully!")
-            # Auto-clear success message after 3 seconds
-            QTimer.singleShot(3000, self.view.clear_messages)
-            
-            # Reset save button state
-            self.view.set_save_button_enabled(False)
+        # Decoding runs in the background; the image arrives via image_loaded
+        self.model.load_image(file_path)
     
     def _on_processor_selection_changed(self, processor_name: str) -> None:
         """
@@ -135,11 +134,14 @@ class MainWindowController:
             QTimer.singleShot(3000, self.view.clear_messages)
             return
         
-        success = self.model.process_image()
-        if success:
-            self.view.show_success_message("Image processed successfully!")
-            # Auto-clear success message after 3 seconds
-            QTimer.singleShot(3000, self.view.clear_messages)
+        # Apply control changes the processor view is still holding back, so
+        # processing starts from the latest values
+        view = self.model.get_processor_view(self.model.current_processor_name)
+        if view is not None and hasattr(view, 'flush_pending_parameters'):
+            view.flush_pending_parameters()
+        
+        # Processing runs in the background; the result arrives via model signals
+        self.model.process_image()
     
     def _on_save_requested(self, file_path: str) -> None:
         """
@@ -155,11 +157,8 @@ class MainWindowController:
             QTimer.singleShot(3000, self.view.clear_messages)
             return
         
-        success = self.model.save_processed_image(file_path)
-        if success:
-            self.view.show_success_message("Image saved successfully!")
-            # Auto-clear success message after 3 seconds
-            QTimer.singleShot(3000, self.view.clear_messages)
+        # Encoding runs in the background; completion arrives via image_saved
+        self.model.save_processed_image(file_path)
     
     def _on_reset_requested(self) -> None:
         """
@@ -187,7 +186,21 @@ class MainWindowController:
             image: Loaded image array
         """
         self.view.display_original_image(image)
-        self.view.clear_messages()  # Clear any previous messages
+        self.view.show_success_message("Image loaded successfully!")
+        # Auto-clear success message after 3 seconds
+        QTimer.singleShot(3000, self.view.clear_messages)
+        
+        # Reset save button state
+        self.view.set_save_button_enabled(False)
+    
+    def _on_loading_started(self) -> None:
+        """Handle image loading started event from model."""
+        self.view.set_loading_state(True)
+        self.view.show_warning_message("Loading image...")
+    
+    def _on_loading_finished(self) -> None:
+        """Handle image loading finished event from model."""
+        self.view.set_loading_state(False)
     
     def _on_image_processed(self, image) -> None:
         """
@@ -199,6 +212,15 @@ class MainWindowController:
         self.view.display_processed_image(image)
         self.view.set_save_button_enabled(True)
     
+    def _on_preview_ready(self, image) -> None:
+        """
+        Handle preview event from model while processing continues.
+        
+        Args:
+            image: Low-resolution processed image
+        """
+        self.view.display_processed_preview(image)
+    
     def _on_processor_changed(self, processor_name: str) -> None:
         """
         Handle processor changed event from model.
@@ -222,6 +244,32 @@ class MainWindowController:
         """Handle processing finished event from model."""
         self.view.set_processing_state(False)
     
+    def _on_processing_succeeded(self) -> None:
+        """Handle successful completion of background processing."""
+        self.view.show_success_message("Image processed successfully!")
+        # Auto-clear success message after 3 seconds
+        QTimer.singleShot(3000, self.view.clear_messages)
+    
+    def _on_saving_started(self) -> None:
+        """Handle saving started event from model."""
+        self.view.set_saving_state(True)
+        self.view.show_warning_message("Saving image...")
+    
+    def _on_saving_finished(self) -> None:
+        """Handle saving finished event from model."""
+        self.view.set_saving_state(False)
+    
+    def _on_image_saved(self, file_path: str) -> None:
+        """
+        Handle image saved event from model.
+        
+        Args:
+            file_path: Path the image was written to
+        """
+        self.view.show_success_message("Image saved successfully!")
+        # Auto-clear success message after 3 seconds
+        QTimer.singleShot(3000, self.view.clear_messages)
+    
     def _on_error_occurred(self, error_message: str) -> None:
         """
         Handle error event from model.
@@ -234,58 +282,47 @@ class MainWindowController:
         # Auto-clear error message after 5 seconds
         QTimer.singleShot(5000, self.view.clear_messages)
     
-    def _on_window_resized(self, event) -> None:
-        """
-        Handle window resize event.
-        
-        Args:
-            event: Resize event
-        """
-        # Call the original resize event handler
-        MainWindowView.resizeEvent(self.view, event)
-        
-        # Update image displays if images exist
-        if self.model.has_original_image:
-            self.view.display_original_image(self.model.original_image)
-            
-        if self.model.has_processed_image:
-            self.view.display_processed_image(self.model.processed_image)
-    
     def cleanup(self) -> None:
         """Clean up controller resources."""
         self.logger.info("Cleaning up main window controller")
         
+        # Disconnect view and model signals from this controller's handlers
+        # first, naming each slot so Qt drops only that connection; the model
+        # and view then find nothing left to disconnect
+        try:
+            self.view.upload_requested.disconnect(self._on_upload_requested)
+            self.view.processor_selection_changed.disconnect(self._on_processor_selection_changed)
+            self.view.process_requested.disconnect(self._on_process_requested)
+            self.view.save_requested.disconnect(self._on_save_requested)
+            self.view.reset_requested.disconnect(self._on_reset_requested)
+            
+            self.model.image_loaded.disconnect(self._on_image_loaded)
+            self.model.loading_started.disconnect(self._on_loading_started)
+            self.model.loading_finished.disconnect(self._on_loading_finished)
+            self.model.image_processed.disconnect(self._on_image_processed)
+            self.model.preview_ready.disconnect(self._on_preview_ready)
+            self.model.processor_changed.disconnect(self._on_processor_changed)
+            self.model.processing_started.disconnect(self._on_processing_started)
+            self.model.processing_finished.disconnect(self._on_processing_finished)
+            self.model.processing_succeeded.disconnect(self._on_processing_succeeded)
+            self.model.saving_started.disconnect(self._on_saving_started)
+            self.model.saving_finished.disconnect(self._on_saving_finished)
+            self.model.image_saved.disconnect(self._on_image_saved)
+            self.model.error_occurred.disconnect(self._on_error_occurred)
+        except (RuntimeError, TypeError):
+            # Already disconnected or never connected
+            pass
+        
         # Clean up model
         if hasattr(self.model, 'cleanup'):
             self.model.cleanup()
         
         # Clean up view
         if hasattr(self.view, 'cleanup'):
-            self.view.cleanup() # View handles its own signal disconnections
+            self.view.cleanup()
         
         # Clean up processor controllers
         if hasattr(self.model, 'processor_controllers'):
             for controller in self.model.processor_controllers.values():
                 if hasattr(controller, 'cleanup'):
                     controller.cleanup()
-        
-        # Disconnect signals connected by this controller to its own methods
-        # (Model signals connected to controller handlers)
-        try:
-            self.model.image_loaded.disconnect(self._on_image_loaded)
-            self.model.image_processed.disconnect(self._on_image_processed)
-            self.model.processor_changed.disconnect(self._on_processor_changed)
-            self.model.processing_started.disconnect(self._on_processing_started)
-            self.model.processing_finished.disconnect(self._on_processing_finished)
-            self.model.error_occurred.disconnect(self._on_error_occurred)
-        except RuntimeError:
-            # Signals might have already been disconnected or were not connected
-            pass
-
-        # Restore original resizeEvent if it was replaced
-        # Assuming the original was QMainWindow.resizeEvent or similar.
-        # This is tricky; ideally, the view manages its own event handlers.
-        # For now, if we overrode it, we can try to set it back to a default
-        # or ensure the view's cleanup handles it.
-        # Given the current code, MainWindowView.resizeEvent is called directly,
-        # so specific disconnection here might not be needed if view cleans up itself. 
\ No newline at end of file
@@ -13,8 +13,7 @@ class CropController(BaseController):
     def __init__(self) -> None:
         """Initialize crop controller with model and view."""
         model = CropModel()
-        view = CropView()
-        super().__init__(model, view)
+        super().__init__(model, CropView)
 
     def _connect_signals(self) -> None:
         """Connect crop-specific signals between view and model."""
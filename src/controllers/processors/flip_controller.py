@@ -13,8 +13,7 @@ class FlipController(BaseController):
     def __init__(self) -> None:
         """Initialize flip controller with model and view."""
         model = FlipModel()
-        view = FlipView()
-        super().__init__(model, view)
+        super().__init__(model, FlipView)
 
     def _connect_signals(self) -> None:
         """Connect flip-specific signals between view and model."""
@@ -10,8 +10,10 @@ class FourierController(BaseController):
     handling parameter changes and frequency domain processing requests.
     """
     
+    # The DFT is costly on large images; show a half-resolution spectrum first
+    PREVIEW_SCALE = 0.5
+    
     def __init__(self) -> None:
         """Initialize Fourier transform controller with model and view."""
         model = FourierModel()
-        view = FourierView()
-        super().__init__(model, view) 
\ No newline at end of file
+        super().__init__(model, FourierView) 
\ No newline at end of file
@@ -13,5 +13,4 @@ class HighpassController(BaseController):
     def __init__(self) -> None:
         """Initialize highpass filter controller with model and view."""
         model = HighpassModel()
-        view = HighpassView()
-        super().__init__(model, view) 
\ No newline at end of file
+        super().__init__(model, HighpassView) 
\ No newline at end of file
@@ -13,8 +13,7 @@ class LowpassController(BaseController):
     def __init__(self) -> None:
         """Initialize lowpass controller with model and view."""
         model = LowpassModel()
-        view = LowpassView()
-        super().__init__(model, view)
+        super().__init__(model, LowpassView)
 
     def _connect_signals(self) -> None:
         """Connect lowpass-specific signals between view and model."""
@@ -13,5 +13,4 @@ class ObjectDetectionController(BaseController):
     def __init__(self) -> None:
         """Initialize object detection controller with model and view."""
         model = ObjectDetectionModel()
-        view = ObjectDetectionView()
-        super().__init__(model, view) 
\ No newline at end of file
+        super().__init__(model, ObjectDetectionView) 
\ No newline at end of file
@@ -13,17 +13,5 @@ class RotationController(BaseController):
     def __init__(self) -> None:
         """Initialize rotation controller with model and view."""
         model = RotationModel()
-        view = RotationView()
-        super().__init__(model, view)
-
-    def _connect_signals(self) -> None:
-        """Connect rotation-specific signals between view and model."""
-        super()._connect_signals()
-        
-        # Connect rotation type changes
-        if hasattr(self.view, 'rotation_type_changed'):
-            self.view.rotation_type_changed.connect(self.model.set_rotation_type)
-            
-        # Connect parameter changes
-        if hasattr(self.view, 'parameters_changed'):
-            self.view.parameters_changed.connect(self.model.set_parameters) 
\ No newline at end of file
+        super().__init__(model, RotationView)
+ 
\ No newline at end of file
@@ -6,10 +6,11 @@ while being independent of the UI components.
 """
 
 from typing import Dict, Any, Optional, Tuple
-import cv2
+import os
 import numpy as np
 import logging
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal
+from models.workers import ImageLoadWorker, ImageProcessingWorker, ImageSaveWorker
 
 class MainWindowModel(QObject):
     """
@@ -20,15 +21,25 @@ class MainWindowModel(QObject):
     """
     
     # Constants following CODE_STANDARDS.md
-    SUPPORTED_FORMATS = ['.png', '.jpg', '.jpeg', '.bmp', '.gif']
+    # Extensions cv2.imread decodes
+    SUPPORTED_FORMATS = ['.png', '.jpg', '.jpeg', '.jpe', '.jp2', '.bmp', '.dib', '.gif',
+                         '.tif', '.tiff', '.webp', '.pbm', '.pgm', '.ppm', '.pnm',
+                         '.sr', '.ras', '.hdr', '.pic']
     DEFAULT_PROCESSOR_NAME = "Select Transformation"
     
     # Signals for notifying view of state changes
     image_loaded = pyqtSignal(np.ndarray)  # Emitted when original image is loaded
+    loading_started = pyqtSignal()  # Emitted when background image loading begins
+    loading_finished = pyqtSignal()  # Emitted when background image loading ends
     image_processed = pyqtSignal(np.ndarray)  # Emitted when processing completes
+    preview_ready = pyqtSignal(np.ndarray)  # Emitted with a low-resolution preview while processing
     processor_changed = pyqtSignal(str)  # Emitted when processor selection changes
     processing_started = pyqtSignal()  # Emitted when processing begins
     processing_finished = pyqtSignal()  # Emitted when processing ends
+    processing_succeeded = pyqtSignal()  # Emitted when processing produced a valid image
+    saving_started = pyqtSignal()  # Emitted when background saving begins
+    saving_finished = pyqtSignal()  # Emitted when background saving ends
+    image_saved = pyqtSignal(str)  # Emitted with the file path when saving succeeds
     error_occurred = pyqtSignal(str)  # Emitted when error occurs
     
     def __init__(self, processor_controllers: Dict[str, Any]) -> None:
@@ -45,6 +56,11 @@ class MainWindowModel(QObject):
         self._current_processor_name: Optional[str] = None
         self._current_processor = None
         self._image_dimensions: Optional[Tuple[int, int]] = None
+        self._thread_pool = QThreadPool.globalInstance()
+        self._processing_worker: Optional[ImageProcessingWorker] = None
+        self._load_worker: Optional[ImageLoadWorker] = None
+        self._loading_file_path: Optional[str] = None
+        self._save_worker: Optional[ImageSaveWorker] = None
         
         self.logger = logging.getLogger(__name__)
     
@@ -78,6 +94,21 @@ class MainWindowModel(QObject):
         """Check if processed image exists."""
         return self._processed_image is not None
     
+    @property
+    def is_loading(self) -> bool:
+        """Check if a background image load is running."""
+        return self._load_worker is not None
+    
+    @property
+    def is_processing(self) -> bool:
+        """Check if a background processing job is running."""
+        return self._processing_worker is not None
+    
+    @property
+    def is_saving(self) -> bool:
+        """Check if a background save is running."""
+        return self._save_worker is not None
+    
     @property
     def can_process(self) -> bool:
         """Check if processing is possible."""
@@ -105,51 +136,98 @@ class MainWindowModel(QObject):
     
     def load_image(self, file_path: str) -> bool:
         """
-        Load image from file path.
+        Start loading an image from file path.
+        
+        The file is decoded on a background thread; image_loaded is emitted
+        once the image is available and loading_finished when the job ends.
         
         Args:
             file_path: Path to image file
             
         Returns:
-            bool: True if image loaded successfully, False otherwise
+            bool: True if loading was started, False otherwise
         """
         # Validate input parameter
         if not isinstance(file_path, str) or not file_path.strip():
             self.error_occurred.emit("Invalid file path provided")
             return False
         
+        # A typed-in name bypasses the open dialog's filter
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension not in self.SUPPORTED_FORMATS:
+            self.error_occurred.emit(f"Unsupported file type: {extension or file_path}")
+            return False
+        
+        if self.is_loading:
+            self.error_occurred.emit("An image is already being loaded")
+            return False
+        
         try:
-            image = cv2.imread(file_path)
-            if image is None:
-                self.error_occurred.emit(f"Failed to load image: {file_path}")
-                return False
-            
-            # Validate image according to standards
-            if not self.validate_image(image):
-                self.error_occurred.emit(f"Invalid image format: {file_path}")
-                return False
+            self.loading_started.emit()
             
-            self._original_image = image
-            self._processed_image = None  # Clear processed image
-            
-            # Store image dimensions
-            height, width = image.shape[:2]
-            self._image_dimensions = (width, height)
-            
-            self.logger.info(f"Image loaded: {file_path} ({width}x{height})")
-            self.image_loaded.emit(image)
-            
-            # Update current processor view with dimensions if available
-            self._update_processor_dimensions()
+            worker = ImageLoadWorker(file_path)
+            worker.signals.finished.connect(self._on_image_load_done)
+            worker.signals.error.connect(self._on_image_load_failed)
+            self._load_worker = worker
+            self._loading_file_path = file_path
+            self._thread_pool.start(worker)
             
             return True
             
         except Exception as e:
+            self._load_worker = None
             error_msg = f"Error loading image: {str(e)}"
             self.logger.error(error_msg)
             self.error_occurred.emit(error_msg)
+            self.loading_finished.emit()
             return False
     
+    def _on_image_load_done(self, image: np.ndarray) -> None:
+        """
+        Handle an image decoded by the load worker.
+        
+        Args:
+            image: Decoded BGR image
+        """
+        file_path = self._loading_file_path
+        self._load_worker = None
+        self.loading_finished.emit()
+        
+        # Validate image according to standards
+        if not self.validate_image(image):
+            self.error_occurred.emit(f"Invalid image format: {file_path}")
+            return
+        
+        # Images are kept read-only so they can be handed to workers and
+        # display caches by reference instead of being copied
+        image.setflags(write=False)
+        self._original_image = image
+        self._processed_image = None  # Clear processed image
+        
+        # Store image dimensions; processing and saving use the full
+        # resolution, only the displayed copies are downsampled
+        height, width = image.shape[:2]
+        self._image_dimensions = (width, height)
+        
+        self.logger.info(f"Image loaded: {file_path} ({width}x{height})")
+        self.image_loaded.emit(image)
+        
+        # Update current processor view with dimensions if available
+        self._update_processor_dimensions()
+    
+    def _on_image_load_failed(self, message: str) -> None:
+        """
+        Handle an error reported by the load worker.
+        
+        Args:
+            message: Error message from the worker
+        """
+        self._load_worker = None
+        error_msg = f"Error loading image: {message}"
+        self.logger.error(error_msg)
+        self.loading_finished.emit()
+        self.error_occurred.emit(error_msg)
+    
     def set_processor(self, processor_name: str) -> bool:
         """
         Set current processor by name.
@@ -195,19 +273,24 @@ class MainWindowModel(QObject):
     
     def process_image(self) -> bool:
         """
-        Process the current image with selected processor.
+        Start processing the current image with the selected processor.
+        
+        Processing runs on a background thread; the result is delivered through
+        image_processed and processing_succeeded, and processing_finished is
+        emitted when the job ends either way.
         
         Returns:
-            bool: True if processing successful, False otherwise
+            bool: True if processing was started, False otherwise
         """
         if not self.can_process:
             self.error_occurred.emit("Cannot process: missing image or processor")
             return False
         
+        if self.is_processing:
+            self.error_occurred.emit("Processing is already in progress")
+            return False
+        
         try:
-            self.processing_started.emit()
-            self.logger.info(f"Processing image with {self._current_processor_name}")
-            
             # Determine the input image for processing
             # If a processed image exists, use it for chained operations.
             # Otherwise, use the original image.
@@ -215,41 +298,91 @@ class MainWindowModel(QObject):
             
             if input_image is None: # Should not happen if can_process is true, but as a safeguard
                 self.error_occurred.emit("No image available for processing")
-                self.processing_finished.emit()
                 return False
-
-            # Process the image
-            processed_result = self._current_processor.process(input_image.copy()) # type: ignore
             
-            if not self.validate_image(processed_result):
-                self.error_occurred.emit(f"Processing with {self._current_processor_name} resulted in an invalid image.")
-                self.processing_finished.emit()
-                return False
-                
-            self._processed_image = processed_result
+            self.processing_started.emit()
+            self.logger.info(f"Processing image with {self._current_processor_name}")
             
-            self.logger.info("Image processing completed successfully")
-            self.image_processed.emit(self._processed_image)
-            self.processing_finished.emit()
+            # The input is read-only, so the worker can share it without a copy
+            preview_scale = getattr(self.processor_controllers[self._current_processor_name],
+                                    'preview_scale', 1.0)
+            worker = ImageProcessingWorker(self._current_processor, input_image, preview_scale)
+            worker.signals.preview.connect(self._on_processing_preview)
+            worker.signals.finished.connect(self._on_processing_done)
+            worker.signals.error.connect(self._on_processing_failed)
+            self._processing_worker = worker
+            self._thread_pool.start(worker)
             
             return True
             
         except Exception as e:
+            self._processing_worker = None
             error_msg = f"Processing failed: {str(e)}"
             self.logger.error(error_msg)
             self.error_occurred.emit(error_msg)
             self.processing_finished.emit()
             return False
     
+    def _on_processing_preview(self, preview_result: np.ndarray) -> None:
+        """
+        Forward a preview delivered by the processing worker.
+        
+        Previews are only displayed; they never replace the processed image,
+        so saving and chained processing always use full resolution.
+        
+        Args:
+            preview_result: Processor output for a downscaled input
+        """
+        if self.validate_image(preview_result):
+            self.preview_ready.emit(preview_result)
+    
+    def _on_processing_done(self, processed_result: np.ndarray) -> None:
+        """
+        Handle a result delivered by the processing worker.
+        
+        Args:
+            processed_result: Image returned by the processor
+        """
+        self._processing_worker = None
+        
+        if not self.validate_image(processed_result):
+            self.error_occurred.emit(f"Processing with {self._current_processor_name} resulted in an invalid image.")
+            self.processing_finished.emit()
+            return
+        
+        processed_result.setflags(write=False)
+        self._processed_image = processed_result
+        
+        self.logger.info("Image processing completed successfully")
+        self.image_processed.emit(self._processed_image)
+        self.processing_finished.emit()
+        self.processing_succeeded.emit()
+    
+    def _on_processing_failed(self, message: str) -> None:
+        """
+        Handle an error reported by the processing worker.
+        
+        Args:
+            message: Error message from the worker
+        """
+        self._processing_worker = None
+        error_msg = f"Processing failed: {message}"
+        self.logger.error(error_msg)
+        self.error_occurred.emit(error_msg)
+        self.processing_finished.emit()
+    
     def save_processed_image(self, file_path: str) -> bool:
         """
-        Save processed image to file.
+        Start saving the processed image to file.
+        
+        Encoding runs on a background thread; image_saved is emitted when the
+        file has been written and saving_finished when the job ends.
         
         Args:
             file_path: Path to save image
             
         Returns:
-            bool: True if saved successfully, False otherwise
+            bool: True if saving was started, False otherwise
         """
         # Validate input parameter
         if not isinstance(file_path, str) or not file_path.strip():
@@ -260,23 +393,56 @@ class MainWindowModel(QObject):
             self.error_occurred.emit("No processed image to save")
             return False
         
+        if self.is_saving:
+            self.error_occurred.emit("An image is already being saved")
+            return False
+        
         try:
-            success = cv2.imwrite(file_path, self._processed_image)
-            if success:
-                self.logger.info(f"Image saved: {file_path}")
-                return True
-            else:
-                error_msg = f"Failed to save image: {file_path}"
-                self.logger.error(error_msg)
-                self.error_occurred.emit(error_msg)
-                return False
+            self.saving_started.emit()
+            
+            # Processing replaces _processed_image rather than modifying it,
+            # so the worker can use the array without a copy
+            worker = ImageSaveWorker(file_path, self._processed_image)
+            worker.signals.finished.connect(self._on_image_save_done)
+            worker.signals.error.connect(self._on_image_save_failed)
+            self._save_worker = worker
+            self._thread_pool.start(worker)
+            
+            return True
                 
         except Exception as e:
+            self._save_worker = None
             error_msg = f"Error saving image: {str(e)}"
             self.logger.error(error_msg)
             self.error_occurred.emit(error_msg)
+            self.saving_finished.emit()
             return False
     
+    def _on_image_save_done(self, file_path: str) -> None:
+        """
+        Handle completion of the save worker.
+        
+        Args:
+            file_path: Path the image was written to
+        """
+        self._save_worker = None
+        self.logger.info(f"Image saved: {file_path}")
+        self.saving_finished.emit()
+        self.image_saved.emit(file_path)
+    
+    def _on_image_save_failed(self, message: str) -> None:
+        """
+        Handle an error reported by the save worker.
+        
+        Args:
+            message: Error message from the worker
+        """
+        self._save_worker = None
+        error_msg = f"Error saving image: {message}"
+        self.logger.error(error_msg)
+        self.saving_finished.emit()
+        self.error_occurred.emit(error_msg)
+    
     def reset_to_original_image(self) -> bool:
         """
         Resets the processed image to the original image.
@@ -290,7 +456,8 @@ class MainWindowModel(QObject):
         
         try:
             self.processing_started.emit() # Optional: signal that an operation is starting
-            self._processed_image = self._original_image.copy()
+            # The original is read-only, so it can be shared instead of copied
+            self._processed_image = self._original_image
             self.logger.info("Image reset to original.")
             self.image_processed.emit(self._processed_image) # Notify view to update with the original
             self.processing_finished.emit() # Optional: signal that an operation finished
@@ -340,6 +507,12 @@ class MainWindowModel(QObject):
         """Clean up model resources."""
         self.logger.info("Cleaning up main window model")
         
+        # Let running load/processing/save jobs finish before releasing their inputs
+        self._thread_pool.waitForDone()
+        self._processing_worker = None
+        self._load_worker = None
+        self._save_worker = None
+        
         # Clear image data
         self._original_image = None
         self._processed_image = None
@@ -347,14 +520,12 @@ class MainWindowModel(QObject):
         self._current_processor_name = None
         self._image_dimensions = None
         
-        # Disconnect all signals
-        try:
-            self.image_loaded.disconnect()
-            self.image_processed.disconnect()
-            self.processor_changed.disconnect()
-            self.processing_started.disconnect()
-            self.processing_finished.disconnect()
-            self.error_occurred.disconnect()
-        except RuntimeError:
-            # Signals already disconnected
-            pass 
\ No newline at end of file
+        # Disconnect all signals; receivers() is checked first because
+        # disconnect() raises for a signal with no connections
+        for signal in (self.image_loaded, self.loading_started, self.loading_finished,
+                       self.image_processed, self.preview_ready, self.processor_changed,
+                       self.processing_started, self.processing_finished,
+                       self.processing_succeeded, self.saving_started,
+                       self.saving_finished, self.image_saved, self.error_occurred):
+            if self.receivers(signal) > 0:
+                signal.disconnect() 
\ No newline at end of file
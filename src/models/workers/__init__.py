@@ -0,0 +1,18 @@
+"""
+Background workers for long-running image operations.
+
+Workers run on a QThreadPool so the UI stays responsive and report
+results back to the GUI thread through Qt signals.
+"""
+
+from .worker_signals import WorkerSignals
+from .image_processing_worker import ImageProcessingWorker
+from .image_load_worker import ImageLoadWorker
+from .image_save_worker import ImageSaveWorker
+
+__all__ = [
+    'WorkerSignals',
+    'ImageProcessingWorker',
+    'ImageLoadWorker',
+    'ImageSaveWorker'
+]
@@ -0,0 +1,37 @@
+import cv2
+import numpy as np
+from PyQt6.QtCore import QRunnable
+from models.workers.worker_signals import WorkerSignals
+
+class ImageLoadWorker(QRunnable):
+    """
+    Worker that reads and decodes an image file off the GUI thread.
+    
+    Decoding large JPEG/PNG files can take hundreds of milliseconds, so it
+    runs on the thread pool while the UI shows a loading placeholder.
+    """
+    
+    def __init__(self, file_path: str) -> None:
+        """
+        Initialize the worker.
+        
+        Args:
+            file_path (str): Path of the image file to load
+        """
+        super().__init__()
+        self.file_path = file_path
+        self.signals = WorkerSignals()
+    
+    def run(self) -> None:
+        """Read and decode the file and emit the resulting BGR image."""
+        try:
+            # np.fromfile + imdecode also handles non-ASCII paths on Windows
+            data = np.fromfile(self.file_path, dtype=np.uint8)
+            image = cv2.imdecode(data, cv2.IMREAD_COLOR)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        if image is None:
+            self.signals.error.emit(f"Failed to load image: {self.file_path}")
+            return
+        self.signals.finished.emit(image)
@@ -0,0 +1,53 @@
+import cv2
+import numpy as np
+from PyQt6.QtCore import QRunnable
+from models.base_model import BaseModel
+from models.workers.worker_signals import WorkerSignals
+
+class ImageProcessingWorker(QRunnable):
+    """
+    Worker that applies a processor to an image off the GUI thread.
+    
+    OpenCV releases the GIL inside its C++ routines, so processing runs
+    in parallel with the event loop instead of freezing the UI.
+    
+    With a preview scale below 1.0 the processor is first run on a
+    downscaled copy and that result is emitted as a preview, so the user
+    sees feedback before the full-resolution result is ready.
+    
+    The input image is the model's read-only original, shared rather than
+    copied; processors must return a new array instead of writing to it.
+    """
+    
+    def __init__(self, processor: BaseModel, image: np.ndarray,
+                 preview_scale: float = 1.0) -> None:
+        """
+        Initialize the worker.
+        
+        Args:
+            processor (BaseModel): Processor to apply
+            image (np.ndarray): Read-only input image shared with the model
+            preview_scale (float): Scale of the preview pass; 1.0 disables it
+        """
+        super().__init__()
+        self.processor = processor
+        self.image = image
+        self.preview_scale = preview_scale
+        self.signals = WorkerSignals()
+    
+    def _emit_preview(self) -> None:
+        """Process a downscaled copy of the image and emit it as a preview."""
+        preview_input = cv2.resize(self.image, None, fx=self.preview_scale,
+                                   fy=self.preview_scale, interpolation=cv2.INTER_AREA)
+        self.signals.preview.emit(self.processor.process(preview_input))
+    
+    def run(self) -> None:
+        """Process the image and emit the result."""
+        try:
+            if self.preview_scale < 1.0:
+                self._emit_preview()
+            result = self.processor.process(self.image)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(result)
@@ -0,0 +1,57 @@
+import os
+import cv2
+import numpy as np
+from PyQt6.QtCore import QRunnable
+from models.workers.worker_signals import WorkerSignals
+
+class ImageSaveWorker(QRunnable):
+    """
+    Worker that encodes and writes an image file off the GUI thread.
+    
+    PNG/JPEG encoding of large images can take seconds, so it runs on the
+    thread pool while the UI stays responsive.
+    """
+    
+    # PNG level 3 encodes roughly twice as fast as OpenCV's default of 6
+    PNG_COMPRESSION = 3
+    JPEG_QUALITY = 90
+    
+    def __init__(self, file_path: str, image: np.ndarray) -> None:
+        """
+        Initialize the worker.
+        
+        Args:
+            file_path (str): Destination file path
+            image (np.ndarray): Image to save; must not be modified while saving
+        """
+        super().__init__()
+        self.file_path = file_path
+        self.image = image
+        self.signals = WorkerSignals()
+    
+    def _get_write_params(self) -> list:
+        """
+        Get encoder parameters for the destination format.
+        
+        Returns:
+            list: cv2.imwrite parameter list
+        """
+        extension = os.path.splitext(self.file_path)[1].lower()
+        if extension == '.png':
+            return [cv2.IMWRITE_PNG_COMPRESSION, self.PNG_COMPRESSION]
+        if extension in ('.jpg', '.jpeg'):
+            return [cv2.IMWRITE_JPEG_QUALITY, self.JPEG_QUALITY,
+                    cv2.IMWRITE_JPEG_OPTIMIZE, 0]
+        return []
+    
+    def run(self) -> None:
+        """Write the image and emit the destination path."""
+        try:
+            success = cv2.imwrite(self.file_path, self.image, self._get_write_params())
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        if not success:
+            self.signals.error.emit(f"Failed to save image: {self.file_path}")
+            return
+        self.signals.finished.emit(self.file_path)
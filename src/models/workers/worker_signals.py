@@ -0,0 +1,13 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+
+class WorkerSignals(QObject):
+    """
+    Signals emitted by background workers.
+    
+    QRunnable is not a QObject, so workers own an instance of this class
+    to deliver results back to the GUI thread.
+    """
+    
+    finished = pyqtSignal(object)  # Emitted with the worker result on success
+    preview = pyqtSignal(object)  # Emitted with a quick intermediate result
+    error = pyqtSignal(str)  # Emitted with an error message on failure
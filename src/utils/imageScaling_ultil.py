@@ -28,15 +28,11 @@ def image_scaling(image: np.ndarray, max_width: int = 650, max_height: int = 650
     scale = min(scale_x, scale_y)
     
     # Calculate new dimensions
-    new_width = int(width * scale)
-    new_height = int(height * scale)
+    new_width = max(1, int(width * scale))
+    new_height = max(1, int(height * scale))
     
-    # Create transformation matrix
-    transformation_matrix = np.float32([
-        [scale, 0, 0], 
-        [0, scale, 0]
-    ])
-    
-    # Apply scaling transformation
-    scaled_image = cv2.warpAffine(image, transformation_matrix, (new_width, new_height))
-    return scaled_image 
\ No newline at end of file
+    # Apply scaling. The caller (DisplayConversionWorker) only shrinks images
+    # to the display bound, and INTER_AREA averages the source pixels instead
+    # of sampling them, so downscaled copies do not alias.
+    scaled_image = cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_AREA)
+    return scaled_image
@@ -10,11 +10,13 @@ from .success_message import SuccessMessage
 from .error_message import ErrorMessage
 from .warning_message import WarningMessage
 from .base_input import BaseInput
+from .image_view import ImageView
 
 __all__ = [
     'BaseMessage',
     'SuccessMessage', 
     'ErrorMessage',
     'WarningMessage',
-    'BaseInput'
+    'BaseInput',
+    'ImageView'
 ] 
\ No newline at end of file
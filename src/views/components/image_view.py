@@ -0,0 +1,118 @@
+from PyQt6.QtWidgets import (QGraphicsView, QGraphicsScene, QGraphicsPixmapItem,
+                             QGraphicsSimpleTextItem, QFrame, QSizePolicy)
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QPixmap, QPainter, QOpenGLContext
+
+try:
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:  # Qt built without OpenGL support
+    QOpenGLWidget = None
+
+class ImageView(QGraphicsView):
+    """
+    Image display widget that lets the graphics system do the final scaling.
+
+    The pixmap is placed in a scene and fitted to the viewport with fitInView,
+    so resizing only changes the view transform instead of rescaling pixels
+    on the CPU. When available, an OpenGL viewport moves that scaling and the
+    blit to the GPU. The QLabel-like setPixmap/pixmap/setText/clear methods
+    keep it a drop-in replacement for the previous image labels.
+
+    While the view is being resized the pixmap is drawn with fast
+    nearest-neighbour sampling; smooth filtering is restored once resize
+    events stop for SMOOTH_RESTORE_DELAY_MS.
+    """
+
+    USE_OPENGL_VIEWPORT = True
+    SMOOTH_RESTORE_DELAY_MS = 150
+    _opengl_available = None  # Probed once per process
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._scene = QGraphicsScene(self)
+        self.setScene(self._scene)
+
+        self._pixmap_item = QGraphicsPixmapItem()
+        self._pixmap_item.setTransformationMode(Qt.TransformationMode.SmoothTransformation)
+        self._scene.addItem(self._pixmap_item)
+
+        self._text_item = QGraphicsSimpleTextItem()
+        self._text_item.hide()
+        self._scene.addItem(self._text_item)
+
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(self.SMOOTH_RESTORE_DELAY_MS)
+        self._smooth_timer.timeout.connect(lambda: self._set_smooth(True))
+
+        self._setup_ui()
+
+    def _setup_ui(self):
+        if self.USE_OPENGL_VIEWPORT and self._can_use_opengl():
+            self.setViewport(QOpenGLWidget())
+        self.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setStyleSheet("background: transparent;")
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.setMinimumSize(1, 1)
+
+    @classmethod
+    def _can_use_opengl(cls) -> bool:
+        """Check that an OpenGL context can be created, else stay on raster."""
+        if cls._opengl_available is None:
+            cls._opengl_available = QOpenGLWidget is not None and QOpenGLContext().create()
+        return cls._opengl_available
+
+    def setPixmap(self, pixmap: QPixmap):
+        """Show a pixmap, fitted to the view."""
+        self._text_item.hide()
+        self._pixmap_item.setPixmap(pixmap)
+        self._pixmap_item.show()
+        self._fit_item(self._pixmap_item)
+
+    def pixmap(self) -> QPixmap:
+        """Get the displayed pixmap; null when nothing is shown."""
+        return self._pixmap_item.pixmap()
+
+    def setText(self, text: str):
+        """Show a text placeholder instead of an image."""
+        self._pixmap_item.setPixmap(QPixmap())
+        self._pixmap_item.hide()
+        self._text_item.setText(text)
+        self._text_item.show()
+        self.resetTransform()
+        self._scene.setSceneRect(self._text_item.boundingRect())
+
+    def clear(self):
+        """Remove the displayed pixmap and text."""
+        self._pixmap_item.setPixmap(QPixmap())
+        self._text_item.setText("")
+        self._text_item.hide()
+        self.resetTransform()
+
+    def _set_smooth(self, smooth: bool):
+        """Switch between smooth and fast pixmap sampling."""
+        mode = (Qt.TransformationMode.SmoothTransformation if smooth
+                else Qt.TransformationMode.FastTransformation)
+        if self._pixmap_item.transformationMode() == mode:
+            return
+        self._pixmap_item.setTransformationMode(mode)
+        self.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, smooth)
+        if smooth:
+            self.viewport().update()
+
+    def _fit_item(self, item):
+        self._scene.setSceneRect(item.boundingRect())
+        if not item.boundingRect().isEmpty():
+            self.fitInView(item, Qt.AspectRatioMode.KeepAspectRatio)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # Refitting only updates the view transform; no pixels are rescaled here
+        if self._pixmap_item.isVisible() and not self.pixmap().isNull():
+            self._set_smooth(False)
+            self._smooth_timer.start()
+            self._fit_item(self._pixmap_item)
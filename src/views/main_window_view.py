@@ -9,14 +9,13 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                            QLabel, QPushButton, QFileDialog, QComboBox,
                            QFrame, QSizePolicy, QStackedWidget)
 from PyQt6.QtGui import QPixmap, QImage
-from PyQt6.QtCore import Qt, pyqtSignal
-from typing import Dict, Any, Optional
-import cv2
+from PyQt6.QtCore import Qt, QEvent, QThreadPool, pyqtSignal
+from collections import OrderedDict
+import os
+from typing import Dict, Any, Callable, Optional, Tuple
 import numpy as np
-from utils.imageScaling_ultil import image_scaling
-from views.components.error_message import ErrorMessage
-from views.components.success_message import SuccessMessage
-from views.components.warning_message import WarningMessage
+from views.components.image_view import ImageView
+from views.workers import DisplayConversionWorker
 
 class MainWindowView(QMainWindow):
     """
@@ -33,7 +32,21 @@ class MainWindowView(QMainWindow):
     MIN_WINDOW_HEIGHT = 600
     CONTROL_PANEL_WIDTH = 400
     MESSAGE_CONTAINER_HEIGHT = 40
+    # One label shows every notification; its "severity" property picks the colours
+    MESSAGE_STYLESHEET = """
+        QLabel { padding: 10px; border-radius: 5px; color: white; background: transparent; }
+        QLabel[severity="success"] { background-color: #4CAF50; }
+        QLabel[severity="error"] { background-color: #f44336; }
+        QLabel[severity="warning"] { background-color: #FFD700; }
+    """
     IMAGE_FRAME_MIN_SIZE = 400
+    DISPLAY_CACHE_MAX_SIZE = 1300  # Display copy bound when the screen size is unknown
+    DISPLAY_CACHE_SIZE = 2  # Number of recent display-resolution copies kept
+    PIXMAP_CACHE_LIMIT_KB = 65536  # Memory budget for recently displayed pixmaps, as QPixmapCache
+    
+    OPEN_FILE_FILTER = ("Image Files (*.png *.jpg *.jpeg *.jpe *.jp2 *.bmp *.dib *.gif "
+                        "*.tif *.tiff *.webp *.pbm *.pgm *.ppm *.pnm *.sr *.ras *.hdr *.pic)")
+    SAVE_FILE_FILTER = "Images (*.png *.jpg *.jpeg *.bmp)"
     
     # Add constant for default processor name
     DEFAULT_PROCESSOR_NAME = "Select Transformation"
@@ -48,7 +61,36 @@ class MainWindowView(QMainWindow):
     def __init__(self) -> None:
         """Initialize the main window view."""
         super().__init__()
-        self._processor_views: Dict[str, QWidget] = {}
+        self._processor_view_factories: Dict[str, Callable[[], QWidget]] = {}
+        self._processor_views: Dict[str, QWidget] = {}  # Views created so far
+        self._processor_view_indexes: Dict[str, int] = {}  # Stack index per processor
+        self._processor_name_to_index: Dict[str, int] = {}  # Combo index per processor
+        self._is_real_processor_selected = False  # Combo shows a processor, not the default entry
+        # Inputs to _refresh_buttons and the enabled states it last applied
+        self._is_loading = False
+        self._is_processing = False
+        self._is_saving = False
+        self._save_allowed = True  # Controller veto, e.g. right after a reset
+        self._button_states: Dict[str, bool] = {}
+        # Directories last used in the file dialogs, so they reopen where the user was
+        self._last_open_dir = ""
+        self._last_save_dir = ""
+        # LRU of (source image, display-resolution copy), keyed by source buffer
+        self._display_caches: "OrderedDict[tuple, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+        # LRU of (display source, pixmap built from it), keyed by source buffer
+        self._pixmap_cache: "OrderedDict[tuple, Tuple[np.ndarray, QPixmap]]" = OrderedDict()
+        # Images whose display was deferred while the window was hidden or minimized
+        self._pending_displays: Dict[ImageView, np.ndarray] = {}
+        # Latest background conversion job per image view; older results are stale
+        self._display_jobs: Dict[ImageView, int] = {}
+        self._next_display_job = 0
+        # Source image each view currently shows; cache entries of replaced sources are dropped
+        self._view_sources: Dict[ImageView, np.ndarray] = {}
+        # Last source of each cleared view; its cache entries are kept until a
+        # different image is displayed there
+        self._cleared_sources: Dict[ImageView, np.ndarray] = {}
+        # Display bound of the current screen, recomputed after show or resize
+        self._display_bound: Optional[int] = None
         self._setup_message_components()  # Create messages first
         self._setup_ui()
     
@@ -64,8 +106,8 @@ class MainWindowView(QMainWindow):
         main_layout.setSpacing(20)
         
         # Create image display frames
-        self.original_frame, self.original_image_label = self._create_image_frame("Original Image")
-        self.processed_frame, self.processed_image_label = self._create_image_frame("Processed Image")
+        self.original_frame, self.original_image_view = self._create_image_frame("Original Image")
+        self.processed_frame, self.processed_image_view = self._create_image_frame("Processed Image")
         
         # Create control panel
         control_panel = self._create_control_panel()
@@ -75,25 +117,14 @@ class MainWindowView(QMainWindow):
         main_layout.addWidget(self.processed_frame, 1)
     
     def _setup_message_components(self) -> None:
-        """Setup message components for notifications."""
-        self.success_message = SuccessMessage()
-        self.error_message = ErrorMessage()
-        self.warning_message = WarningMessage()
-        
-        # Create a fixed-height container for messages to prevent UI jumping
-        self.message_container = QWidget()
-        self.message_container.setFixedHeight(self.MESSAGE_CONTAINER_HEIGHT)  # Fixed height for up to 3 messages
-        self.message_layout = QVBoxLayout(self.message_container)
-        self.message_layout.setContentsMargins(0, 0, 0, 0)
-        self.message_layout.setSpacing(5)
-        
-        # Add all message components to the container
-        self.message_layout.addWidget(self.warning_message)
-        self.message_layout.addWidget(self.success_message)
-        self.message_layout.addWidget(self.error_message)
-        
-        # Add stretch to push messages to top of container
-        self.message_layout.addStretch()
+        """Setup the message label for notifications."""
+        # A single fixed-height label avoids re-laying out the panel on every
+        # message; it stays in place with empty text when there is nothing to show
+        self.message_label = QLabel("")
+        self.message_label.setFixedHeight(self.MESSAGE_CONTAINER_HEIGHT)
+        self.message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.message_label.setStyleSheet(self.MESSAGE_STYLESHEET)
+        self.message_label.setProperty("severity", "")
     
     def _create_image_frame(self, title: str) -> tuple:
         """
@@ -103,7 +134,7 @@ class MainWindowView(QMainWindow):
             title: Title for the frame
             
         Returns:
-            tuple: (frame, image_label) widgets
+            tuple: (frame, image_view) widgets
         """
         frame = QFrame()
         frame.setFrameStyle(QFrame.Shape.StyledPanel)
@@ -124,14 +155,12 @@ class MainWindowView(QMainWindow):
         image_layout = QVBoxLayout(image_container)
         image_layout.setContentsMargins(0, 0, 0, 0)
         
-        image_label = QLabel()
-        image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        image_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        image_layout.addWidget(image_label)
+        image_view = ImageView()
+        image_layout.addWidget(image_view)
         
         layout.addWidget(image_container)
 
-        return frame, image_label
+        return frame, image_view
     
     def _create_control_panel(self) -> QWidget:
         """
@@ -145,8 +174,8 @@ class MainWindowView(QMainWindow):
         layout = QVBoxLayout(panel)
         layout.setContentsMargins(10, 10, 10, 10)
         
-        # Add fixed message container at the top
-        layout.addWidget(self.message_container)
+        # Add fixed message label at the top
+        layout.addWidget(self.message_label)
         
         # Upload button
         self.upload_button = QPushButton("Upload Image")
@@ -183,27 +212,39 @@ class MainWindowView(QMainWindow):
         layout.addStretch()
         return panel
     
-    def setup_processor_views(self, processor_views: Dict[str, QWidget]) -> None:
+    def setup_processor_views(self, processor_view_factories: Dict[str, Callable[[], QWidget]]) -> None:
         """
         Setup processor views in the stack widget.
         
         Args:
-            processor_views: Dictionary mapping processor names to view widgets
+            processor_view_factories: Dictionary mapping processor names to
+                callables returning their view widgets
         """
-        self._processor_views = processor_views
-        
-        # Clear existing views
-        while self.views_stack.count() > 0:
-            widget = self.views_stack.widget(0)
-            self.views_stack.removeWidget(widget)
+        # Views already created belong to their controllers and may be returned again
+        created_views = list(self._processor_views.values())
+        self._processor_view_factories = processor_view_factories
+        self._processor_views = {}
+        self._processor_view_indexes = {}
         
-        # Add empty widget for default state
-        empty_widget = QWidget()
-        self.views_stack.addWidget(empty_widget)
-        
-        # Add processor views
-        for name, view in processor_views.items():
-            self.views_stack.addWidget(view)
+        self.setUpdatesEnabled(False)
+        try:
+            if self.views_stack.count() > 0:
+                # Detach the controller-owned views, then swap in a fresh stack
+                # and drop the old one with its remaining children in one go,
+                # instead of removing and re-laying out widget by widget
+                for view in created_views:
+                    self.views_stack.removeWidget(view)
+                    view.setParent(None)
+                new_stack = QStackedWidget()
+                self.views_stack.parentWidget().layout().replaceWidget(self.views_stack, new_stack)
+                self.views_stack.deleteLater()
+                self.views_stack = new_stack
+            
+            # Add empty widget for default state. Processor views are created
+            # and inserted on first selection, so unused ones are never built.
+            self.views_stack.addWidget(QWidget())
+        finally:
+            self.setUpdatesEnabled(True)
     
     def set_processor_names(self, processor_names: list) -> None:
         """
@@ -214,6 +255,7 @@ class MainWindowView(QMainWindow):
         """
         self.processor_combo.clear()
         self.processor_combo.addItems(processor_names)
+        self._processor_name_to_index = {name: i for i, name in enumerate(processor_names)}
     
     def display_original_image(self, image: np.ndarray) -> None:
         """
@@ -224,27 +266,26 @@ class MainWindowView(QMainWindow):
         """
         # Validate input according to standards
         if image is None or not isinstance(image, np.ndarray):
-            self.process_button.setEnabled(False)
-            self.reset_button.setEnabled(False)
-            self.save_button.setEnabled(False)
             # Optionally clear image labels or show placeholder
-            self.original_image_label.clear()
-            self.processed_image_label.clear()
+            self._clear_image_view(self.original_image_view)
+            self._clear_image_view(self.processed_image_view)
+            self._display_caches.clear()
+            self._pixmap_cache.clear()
+            self._cleared_sources.clear()
+            self._refresh_buttons()
             return
         
-        frame_width = self.original_frame.width() - 20
-        frame_height = self.original_frame.height() - 60
-        
-        display_img = image_scaling(image, max_width=frame_width, max_height=frame_height)
-        self._display_image(display_img, self.original_image_label)
-        
-        # Enable process and reset buttons when original image is displayed
-        self.process_button.setEnabled(self.processor_combo.currentText() != self.DEFAULT_PROCESSOR_NAME)
-        self.reset_button.setEnabled(True)
-        # Save button remains disabled until there's a processed image
-        self.save_button.setEnabled(False) 
-        # Clear processed image display when a new original image is loaded
-        self.processed_image_label.clear()
+        is_new_original = self._view_sources.get(self.original_image_view) is not image
+        self._display_image(image, self.original_image_view)
+        
+        # Clear processed image display when a new original image is loaded;
+        # save stays disabled until there's a new processed image
+        self._clear_image_view(self.processed_image_view)
+        if is_new_original:
+            # The model has dropped the previous result, so its caches go too
+            self._drop_cleared_sources()
+        self._save_allowed = False
+        self._refresh_buttons()
     
     def display_processed_image(self, image: np.ndarray) -> None:
         """
@@ -255,20 +296,25 @@ class MainWindowView(QMainWindow):
         """
         # Validate input according to standards
         if image is None or not isinstance(image, np.ndarray):
-            self.save_button.setEnabled(False)
             # Optionally clear processed image label or show placeholder
-            self.processed_image_label.clear()
+            self._clear_image_view(self.processed_image_view)
+            self._refresh_buttons()
             return
         
-        frame_width = self.processed_frame.width() - 20
-        frame_height = self.processed_frame.height() - 60
+        self._display_image(image, self.processed_image_view)
+        self._save_allowed = True # Enable save button when processed image is displayed
+        self._refresh_buttons()
+    
+    def display_processed_preview(self, image: np.ndarray) -> None:
+        """
+        Display a preview in the processed image frame without changing button states.
         
-        display_img = image_scaling(image, max_width=frame_width, max_height=frame_height)
-        self._display_image(display_img, self.processed_image_label)
-        self.save_button.setEnabled(True) # Enable save button when processed image is displayed
-        self.reset_button.setEnabled(True) # Ensure reset is available if there's a processed image
-        # Process button should still be enabled if a processor is selected
-        self.process_button.setEnabled(self.processor_combo.currentText() != self.DEFAULT_PROCESSOR_NAME)
+        Args:
+            image: Preview image to display
+        """
+        if image is None or not isinstance(image, np.ndarray):
+            return
+        self._display_image(image, self.processed_image_view)
     
     def set_processor_selection(self, processor_name: str) -> None:
         """
@@ -279,21 +325,23 @@ class MainWindowView(QMainWindow):
         """
         # Block signals to prevent feedback loop if called programmatically
         self.processor_combo.blockSignals(True)
-        current_index = self.processor_combo.findText(processor_name)
-        if current_index != -1:
+        current_index = self._processor_name_to_index.get(processor_name)
+        if current_index is not None:
             self.processor_combo.setCurrentIndex(current_index)
+            self._is_real_processor_selected = processor_name != self.DEFAULT_PROCESSOR_NAME
         else:
+            self._is_real_processor_selected = False
             # If processor_name is not in combo, select default (empty)
-            default_index = self.processor_combo.findText(self.DEFAULT_PROCESSOR_NAME)
-            if default_index != -1:
+            default_index = self._processor_name_to_index.get(self.DEFAULT_PROCESSOR_NAME)
+            if default_index is not None:
                 self.processor_combo.setCurrentIndex(default_index)
             else: # Fallback if default isn't even there (should not happen)
                 self.processor_combo.setCurrentIndex(0)
         self.processor_combo.blockSignals(False)
         
         # Update current view in stack
-        if processor_name in self._processor_views:
-            self.views_stack.setCurrentWidget(self._processor_views[processor_name])
+        if processor_name in self._processor_view_factories:
+            self.views_stack.setCurrentIndex(self._get_processor_view_index(processor_name))
         else:
             # Select empty widget if no specific processor or default is chosen
             # Ensure index 0 is always the placeholder/empty widget.
@@ -302,10 +350,25 @@ class MainWindowView(QMainWindow):
                 self.views_stack.setCurrentIndex(0) 
             
         # Enable or disable process button based on selection and image presence
-        is_processor_selected = processor_name != self.DEFAULT_PROCESSOR_NAME
-        can_process_now = is_processor_selected and self.original_image_label.pixmap() is not None and \
-                          not self.original_image_label.pixmap().isNull()
-        self.process_button.setEnabled(can_process_now)
+        self._refresh_buttons()
+    
+    def _get_processor_view_index(self, processor_name: str) -> int:
+        """
+        Get the stack index of a processor view, creating and inserting it on first use.
+        
+        Args:
+            processor_name: Name of processor whose view is needed
+            
+        Returns:
+            int: Index of the view in the views stack
+        """
+        index = self._processor_view_indexes.get(processor_name)
+        if index is None:
+            view = self._processor_view_factories[processor_name]()
+            self._processor_views[processor_name] = view
+            index = self.views_stack.addWidget(view)
+            self._processor_view_indexes[processor_name] = index
+        return index
     
     def set_save_button_enabled(self, enabled: bool) -> None:
         """
@@ -314,7 +377,37 @@ class MainWindowView(QMainWindow):
         Args:
             enabled: Whether to enable the save button
         """
-        self.save_button.setEnabled(enabled)
+        self._save_allowed = enabled
+        self._refresh_buttons()
+    
+    def _refresh_buttons(self) -> None:
+        """
+        Apply the enabled state of the controls from the current view state.
+        
+        Every state change funnels through here, and only controls whose
+        state actually changes are touched.
+        """
+        is_busy = self._is_loading or self._is_processing
+        has_original = self._has_image(self.original_image_view)
+        states = {
+            "upload": not is_busy,
+            "combo": not is_busy,
+            "process": not is_busy and has_original and self._is_real_processor_selected,
+            "reset": not is_busy and has_original,
+            "save": (not is_busy and not self._is_saving and self._save_allowed and
+                     self._has_image(self.processed_image_view))
+        }
+        widgets = {
+            "upload": self.upload_button,
+            "combo": self.processor_combo,
+            "process": self.process_button,
+            "reset": self.reset_button,
+            "save": self.save_button
+        }
+        for name, enabled in states.items():
+            if self._button_states.get(name) != enabled:
+                self._button_states[name] = enabled
+                widgets[name].setEnabled(enabled)
     
     def set_processing_state(self, is_processing: bool) -> None:
         """
@@ -323,13 +416,8 @@ class MainWindowView(QMainWindow):
         Args:
             is_processing: True if processing, False otherwise
         """
-        self.upload_button.setEnabled(not is_processing)
-        self.processor_combo.setEnabled(not is_processing)
-        self.process_button.setEnabled(not is_processing and \
-                                     self.original_image_label.pixmap() is not None and \
-                                     self.processor_combo.currentText() != self.DEFAULT_PROCESSOR_NAME)
-        self.reset_button.setEnabled(not is_processing and self.original_image_label.pixmap() is not None)
-        self.save_button.setEnabled(not is_processing and self.processed_image_label.pixmap() is not None)
+        self._is_processing = is_processing
+        self._refresh_buttons()
         
         # Disable processor-specific view controls if they exist and are QWidget
         current_view_widget = self.views_stack.currentWidget()
@@ -348,69 +436,366 @@ class MainWindowView(QMainWindow):
         else:
             self.process_button.setText("Process Image")
     
+    def set_loading_state(self, is_loading: bool) -> None:
+        """
+        Set UI state while an image is being loaded in the background.
+
+        Args:
+            is_loading: True if loading, False otherwise
+        """
+        self._is_loading = is_loading
+
+        # The current images stay on screen until the new one has decoded, so
+        # a failed load leaves them and their caches as they were;
+        # display_original_image replaces them once image_loaded arrives
+        if is_loading:
+            self._drop_cleared_sources()
+            self.setCursor(Qt.CursorShape.WaitCursor)
+        else:
+            self.setCursor(Qt.CursorShape.ArrowCursor)
+        self._refresh_buttons()
+
+    def set_saving_state(self, is_saving: bool) -> None:
+        """
+        Set UI state while the processed image is being saved.
+        
+        Args:
+            is_saving: True if saving, False otherwise
+        """
+        self._is_saving = is_saving
+        self._refresh_buttons()
+        self.save_button.setText("Saving..." if is_saving else "Save Processed Image")
+    
     def show_success_message(self, message: str) -> None:
         """Show success message."""
-        self._clear_all_messages()
-        self.success_message.show_message(message)
+        self._show_message(message, "success")
     
     def show_error_message(self, message: str) -> None:
         """Show error message."""
-        self._clear_all_messages()
-        self.error_message.show_message(message)
+        self._show_message(message, "error")
     
     def show_warning_message(self, message: str) -> None:
         """Show warning message."""
-        self._clear_all_messages()
-        self.warning_message.show_message(message)
+        self._show_message(message, "warning")
     
     def clear_messages(self) -> None:
         """Clear all messages."""
-        self._clear_all_messages()
+        self._show_message("", "")
     
-    def _clear_all_messages(self) -> None:
-        """Clear all message components."""
-        self.success_message.clear_message()
-        self.error_message.clear_message()
-        self.warning_message.clear_message()
+    def _show_message(self, message: str, severity: str) -> None:
+        """
+        Show a message in the message label.
+        
+        Args:
+            message: Text to show, empty to clear
+            severity: "success", "error" or "warning", empty for no styling
+        """
+        self.message_label.setText(message)
+        if self.message_label.property("severity") != severity:
+            self.message_label.setProperty("severity", severity)
+            # Re-polish so the property selectors in the stylesheet apply
+            style = self.message_label.style()
+            style.unpolish(self.message_label)
+            style.polish(self.message_label)
     
-    def _display_image(self, image: np.ndarray, image_label: QLabel) -> None:
+    def _clear_image_view(self, image_view: ImageView) -> None:
         """
-        Display an image in the specified label.
+        Clear an image view, dropping any display deferred or in progress for it.
         
         Args:
-            image: Image to display
-            image_label: Label widget to display image in
+            image_view: Image view widget to clear
+        """
+        self._pending_displays.pop(image_view, None)
+        self._display_jobs.pop(image_view, None)
+        self._set_view_source(image_view, None)
+        image_view.clear()
+    
+    def _has_image(self, image_view: ImageView) -> bool:
+        """
+        Check if an image view shows, or is about to show, an image.
+        
+        Reads the recorded source images, so button state updates make no
+        pixmap getter calls into Qt.
+        
+        Args:
+            image_view: Image view widget to check
+            
+        Returns:
+            bool: True if an image was displayed in the view and not cleared since
+        """
+        return image_view in self._view_sources
+    
+    def _flush_pending_displays(self) -> None:
+        """Display images that were deferred while the window was not visible."""
+        for image_view, image in list(self._pending_displays.items()):
+            self._display_image(image, image_view)
+    
+    def _get_display_bound(self) -> int:
+        """
+        Get the largest size an image can be displayed at on this screen.
+        
+        The value is cached so repeated displays make no screen queries; show
+        and resize events drop it, since the window may be on another screen.
+        
+        Returns:
+            int: Longest screen side in device pixels
+        """
+        if self._display_bound is None:
+            screen = self.screen()
+            if screen is None:
+                return self.DISPLAY_CACHE_MAX_SIZE
+            size = screen.availableGeometry().size() * screen.devicePixelRatio()
+            self._display_bound = max(size.width(), size.height())
+        return self._display_bound
+    
+    def _set_view_source(self, image_view: ImageView, image: Optional[np.ndarray]) -> None:
+        """
+        Record the source image of a view and drop the caches of the one it replaces.
+        
+        The model keeps only the current original and processed images, so a
+        source replaced by a different image (an earlier upload, result or
+        preview) will not be displayed again and its cache entries are freed.
+        Clearing a view keeps them, since the cleared image may be shown again.
+        
+        Args:
+            image_view: Image view widget
+            image: New source image, or None when the view is cleared
         """
+        previous = self._view_sources.pop(image_view, None)
         if image is None:
+            if previous is not None:
+                self._cleared_sources[image_view] = previous
             return
+        self._view_sources[image_view] = image
+        if previous is None:
+            previous = self._cleared_sources.pop(image_view, None)
+        else:
+            self._cleared_sources.pop(image_view, None)
+        if previous is not None and previous is not image:
+            self._evict_display_source(previous)
+    
+    def _drop_cleared_sources(self) -> None:
+        """Free the cache entries of images that were cleared from their views."""
+        for image_view, image in list(self._cleared_sources.items()):
+            del self._cleared_sources[image_view]
+            self._evict_display_source(image)
+    
+    def _evict_display_source(self, image: np.ndarray) -> None:
+        """
+        Drop the display copy and pixmap of an image no view shows anymore.
+        
+        Args:
+            image: Source image
+        """
+        if self._is_view_source(image):
+            return
+        cached = self._display_caches.pop(self._get_buffer_key(image), None)
+        display_copy = cached[1] if cached is not None else image
+        self._pixmap_cache.pop(self._get_buffer_key(display_copy), None)
+    
+    def _is_view_source(self, image: np.ndarray) -> bool:
+        """
+        Check if any image view currently shows an image.
+        
+        Args:
+            image: Source image
+            
+        Returns:
+            bool: True if the image is the source of an image view
+        """
+        return any(source is image for source in self._view_sources.values())
+    
+    def _get_cached_display_source(self, image: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Look up the display-resolution copy of an image.
+        
+        Images larger than the screen are downsampled once to the largest
+        size the window can reach and the copy is reused for every later
+        display of the same array, in either frame.
+        
+        Args:
+            image: Full-resolution image
             
-        height, width = image.shape[:2]
-        rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-        qt_image = QImage(rgb_image.tobytes(), width, height, 3 * width, QImage.Format.Format_RGB888)
+        Returns:
+            Optional[np.ndarray]: Cached display copy, or None on a miss
+        """
+        key = self._get_buffer_key(image)
+        cached = self._display_caches.get(key)
+        if cached is None:
+            return None
+        self._display_caches.move_to_end(key)
+        return cached[1]
+    
+    def _cache_display_source(self, image: np.ndarray, display_copy: np.ndarray) -> None:
+        """
+        Store the display-resolution copy of an image, evicting the least recent entry.
+        
+        Args:
+            image: Full-resolution image
+            display_copy: Display copy, or the image itself if it fits the screen
+        """
+        # Keep the source with its copy so its buffer address cannot be reused
+        self._display_caches[self._get_buffer_key(image)] = (image, display_copy)
+        while len(self._display_caches) > self.DISPLAY_CACHE_SIZE:
+            self._display_caches.popitem(last=False)
+    
+    def _display_image(self, image: np.ndarray, image_view: ImageView) -> None:
+        """
+        Display an image in the specified image view.
+        
+        Recently displayed images are shown from the caches immediately.
+        Otherwise downsampling and colour conversion run on a background
+        worker and the view is updated when _on_display_converted receives
+        the result; the view fits the pixmap to its size either way.
+        
+        Args:
+            image: Image to display
+            image_view: Image view widget to display image in
+        """
+        if image is None:
+            return
+        self._set_view_source(image_view, image)
+        
+        # Nothing is drawn while hidden or minimized; display once shown again
+        if not self.isVisible() or self.isMinimized():
+            self._pending_displays[image_view] = image
+            return
+        self._pending_displays.pop(image_view, None)
+        
+        # Re-displaying a recent source (after a resize, reset or re-selection)
+        # reuses its pixmap and skips the conversion entirely
+        display_img = self._get_cached_display_source(image)
+        if display_img is not None:
+            pixmap = self._get_cached_pixmap(display_img)
+            if pixmap is not None:
+                self._display_jobs.pop(image_view, None)
+                image_view.setPixmap(pixmap)
+                return
+        
+        self._next_display_job += 1
+        job_id = self._next_display_job
+        self._display_jobs[image_view] = job_id
+        worker = DisplayConversionWorker(job_id, image, display_img, self._get_display_bound())
+        worker.signals.finished.connect(self._on_display_converted)
+        worker.signals.error.connect(self._on_display_failed)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_display_converted(self, job_id: int, image: np.ndarray,
+                              display_copy: np.ndarray, qt_image: QImage) -> None:
+        """
+        Finish a background display conversion on the GUI thread.
+        
+        Args:
+            job_id: Identifier of the finished job
+            image: Full-resolution source image
+            display_copy: Display-resolution copy the QImage was built from
+            qt_image: Converted Format_RGB32 image
+        """
+        # A source no view shows anymore would only take cache space
+        if not self._is_view_source(image):
+            return
+        self._cache_display_source(image, display_copy)
+        # Use the static fromImage conversion rather than the QPixmap(QImage)
+        # constructor, and let the view transform do the scaling instead of
+        # pixmap.scaled()
         pixmap = QPixmap.fromImage(qt_image)
+        self._cache_pixmap(display_copy, pixmap)
         
-        # Scale pixmap to fit label while maintaining aspect ratio
-        scaled_pixmap = pixmap.scaled(
-            image_label.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
+        for image_view, latest_job in list(self._display_jobs.items()):
+            if latest_job == job_id:
+                del self._display_jobs[image_view]
+                image_view.setPixmap(pixmap)
+    
+    def _on_display_failed(self, job_id: int, message: str) -> None:
+        """
+        Handle a background display conversion that raised.
+        
+        The view keeps whatever it showed before; the job is dropped so
+        later displays of the view are not treated as superseded.
+        
+        Args:
+            job_id: Identifier of the failed job
+            message: Error message from the worker
+        """
+        for image_view, latest_job in list(self._display_jobs.items()):
+            if latest_job == job_id:
+                del self._display_jobs[image_view]
+                self.show_error_message(f"Could not display image: {message}")
+    
+    @staticmethod
+    def _get_buffer_key(image: np.ndarray) -> tuple:
+        """
+        Get a cache key identifying an image's pixel buffer.
         
-        image_label.setPixmap(scaled_pixmap)
+        Args:
+            image: Image array
+            
+        Returns:
+            tuple: (data address, shape, strides)
+        """
+        return (image.ctypes.data, image.shape, image.strides)
+    
+    def _get_cached_pixmap(self, image: np.ndarray) -> Optional[QPixmap]:
+        """
+        Look up the pixmap previously built from an image.
+        
+        Args:
+            image: Display source image
+            
+        Returns:
+            Optional[QPixmap]: Cached pixmap, or None on a miss
+        """
+        key = self._get_buffer_key(image)
+        cached = self._pixmap_cache.get(key)
+        if cached is None:
+            return None
+        self._pixmap_cache.move_to_end(key)
+        return cached[1]
+    
+    def _cache_pixmap(self, image: np.ndarray, pixmap: QPixmap) -> None:
+        """
+        Store the pixmap built from an image, evicting least recent entries.
+        
+        Like QPixmapCache the cache is bounded by pixel memory rather than
+        entry count, so several small images fit where one huge one would.
+        The image itself is kept with the pixmap so its buffer address cannot
+        be reused by another array while the entry exists; a global
+        QPixmapCache keyed by address could not guarantee that.
+        
+        Args:
+            image: Display source image
+            pixmap: Pixmap built from the image
+        """
+        self._pixmap_cache[self._get_buffer_key(image)] = (image, pixmap)
+        limit = self.PIXMAP_CACHE_LIMIT_KB * 1024
+        # Always keep the newest entry, even if it alone exceeds the budget
+        while len(self._pixmap_cache) > 1 and self._get_pixmap_cache_cost() > limit:
+            self._pixmap_cache.popitem(last=False)
+    
+    def _get_pixmap_cache_cost(self) -> int:
+        """
+        Get the pixel memory held by the pixmap cache.
+        
+        Returns:
+            int: Total size of the cached pixmaps in bytes
+        """
+        return sum(pixmap.width() * pixmap.height() * pixmap.depth() // 8
+                   for _, pixmap in self._pixmap_cache.values())
     
     # Event handlers that emit signals for controller
     
     def _on_upload_clicked(self) -> None:
         """Handle upload button click."""
         file_name, _ = QFileDialog.getOpenFileName(
-            self, "Open Image File", "",
-            "Image Files (*.png *.jpg *.jpeg *.bmp *.gif)")
+            self, "Open Image File", self._last_open_dir, self.OPEN_FILE_FILTER)
             
         if file_name:
+            self._last_open_dir = os.path.dirname(file_name)
             self.upload_requested.emit(file_name)
     
     def _on_processor_changed(self, processor_name: str) -> None:
         """Handle processor selection change."""
+        self._is_real_processor_selected = processor_name != self.DEFAULT_PROCESSOR_NAME
         self.processor_selection_changed.emit(processor_name)
         # The controller will call set_processor_selection, which updates the UI accordingly.
     
@@ -421,7 +806,7 @@ class MainWindowView(QMainWindow):
     def _on_save_clicked(self) -> None:
         """Handle save button click."""
         # Ensure there's a processed image to save
-        if self.processed_image_label.pixmap() is None or self.processed_image_label.pixmap().isNull():
+        if not self._has_image(self.processed_image_view):
             self.show_error_message("No processed image to save.")
             return
 
@@ -429,56 +814,60 @@ class MainWindowView(QMainWindow):
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Save Processed Image",
-            "", # Default directory
-            "Images (*.png *.jpg *.jpeg *.bmp)" 
+            # Default to the last save folder, else the folder images come from
+            self._last_save_dir or self._last_open_dir,
+            self.SAVE_FILE_FILTER
         )
         if file_path:
+            self._last_save_dir = os.path.dirname(file_path)
             self.save_requested.emit(file_path)
     
     def _on_reset_clicked(self) -> None:
         """Handle reset button click."""
         self.reset_requested.emit()
     
+    def showEvent(self, event) -> None:
+        """Handle window show event."""
+        super().showEvent(event)
+        self._display_bound = None
+        self._flush_pending_displays()
+    
+    def changeEvent(self, event) -> None:
+        """Handle window state changes such as restoring from minimized."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange and not self.isMinimized():
+            self._flush_pending_displays()
+    
     def resizeEvent(self, event) -> None:
         """Handle window resize event."""
         super().resizeEvent(event)
-        # Note: Image updates should be handled by controller
-        # This just calls the parent resize event
+        # The image views refit their pixmaps on their own resize events
+        self._display_bound = None
     
     def cleanup(self) -> None:
         """Clean up resources, disconnect signals."""
-        try:
-            # Disconnect signals to prevent errors on close
-            self.upload_requested.disconnect()
-            self.processor_selection_changed.disconnect()
-            self.process_requested.disconnect()
-            self.save_requested.disconnect()
-            self.reset_requested.disconnect() # Keep one disconnect for reset_requested
-        except RuntimeError:
-            # Signals already disconnected or never connected
-            pass
-        
-        # Clean up message components if they exist
-        if hasattr(self, 'success_message') and self.success_message:
-            self.success_message.deleteLater()
-        if hasattr(self, 'error_message') and self.error_message:
-            self.error_message.deleteLater()
-        if hasattr(self, 'warning_message') and self.warning_message:
-            self.warning_message.deleteLater()
+        # Receivers of the view signals disconnect their own slots by reference
+        self._display_caches.clear()
+        self._pixmap_cache.clear()
+        self._pending_displays.clear()
+        self._display_jobs.clear()
+        self._view_sources.clear()
+        self._cleared_sources.clear()
+        
+        # Clean up message label if it exists
+        if hasattr(self, 'message_label') and self.message_label:
+            self.message_label.deleteLater()
 
-        # Clear processor views from stack and delete them
+        # Let the created processor views release their resources, then delete
+        # the stack; Qt deletes its children along with it
+        for view_widget in self._processor_views.values():
+            if hasattr(view_widget, 'cleanup'):
+                view_widget.cleanup()
         if hasattr(self, 'views_stack'):
-            while self.views_stack.count() > 0:
-                widget = self.views_stack.widget(0)
-                self.views_stack.removeWidget(widget)
-                # Check if the widget is one of the processor views we stored
-                # and call its cleanup if it has one
-                for name, view_widget in list(self._processor_views.items()):
-                    if view_widget == widget:
-                        if hasattr(view_widget, 'cleanup'):
-                            view_widget.cleanup()
-                        del self._processor_views[name] # Remove from our tracking dict
-                widget.deleteLater() # Delete the widget itself
+            self.views_stack.deleteLater()
+        # Views that were never selected were never created
         self._processor_views.clear()
+        self._processor_view_factories.clear()
+        self._processor_view_indexes.clear()
 
         super().close() # Ensure QMainWindow's own cleanup happens if needed 
\ No newline at end of file
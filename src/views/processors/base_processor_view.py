@@ -1,6 +1,8 @@
-from typing import Dict, Any
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QComboBox, QHBoxLayout
-from PyQt6.QtCore import pyqtSignal
+from contextlib import contextmanager
+from typing import Dict, Any, Tuple, Callable, Iterator
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QComboBox, QHBoxLayout,
+                             QGridLayout, QSlider, QSpinBox, QDoubleSpinBox)
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSignalBlocker
 import logging
 
 class BaseProcessorView(QWidget):
@@ -13,6 +15,9 @@ class BaseProcessorView(QWidget):
     
     parameters_changed = pyqtSignal(dict)
     
+    # Minimum interval between throttled parameters_changed emissions
+    EMIT_THROTTLE_MS = 50
+    
     def __init__(self, title: str) -> None:
         """
         Initialize the base processor view.
@@ -22,6 +27,12 @@ class BaseProcessorView(QWidget):
         """
         super().__init__()
         self.title = title
+        self._last_params = None  # Copy of the last emitted parameters
+        self._emit_pending = False
+        self._throttle_timer = QTimer(self)
+        self._throttle_timer.setSingleShot(True)
+        self._throttle_timer.setInterval(self.EMIT_THROTTLE_MS)
+        self._throttle_timer.timeout.connect(self._on_throttle_timeout)
         self._setup_ui()
         
     def _setup_ui(self) -> None:
@@ -81,18 +92,234 @@ class BaseProcessorView(QWidget):
         self.layout.addWidget(container)
         return layout
         
+    def _create_linked_slider(self, label: str, slider_range: Tuple[int, int], slider_value: int,
+                              spinbox_range: Tuple[float, float], spinbox_value: float,
+                              tick_interval: int, suffix: str = "", spinbox_width: int = 100,
+                              decimals: int = 1,
+                              single_step: float = 1.0) -> Tuple[QWidget, QSlider, QDoubleSpinBox]:
+        """
+        Create a labeled slider with a spinbox showing the same value.
+        
+        The caller connects both widgets, either with _link_slider_spinbox or
+        with its own handlers that sync them through _sync_peer.
+        
+        Args:
+            label (str): Label text shown above the controls
+            slider_range (Tuple[int, int]): Slider minimum and maximum
+            slider_value (int): Initial slider value
+            spinbox_range (Tuple[float, float]): Spinbox minimum and maximum
+            spinbox_value (float): Initial spinbox value
+            tick_interval (int): Slider tick interval
+            suffix (str): Spinbox suffix
+            spinbox_width (int): Fixed spinbox width in pixels
+            decimals (int): Spinbox decimals
+            single_step (float): Spinbox step
+            
+        Returns:
+            Tuple[QWidget, QSlider, QDoubleSpinBox]: Container, slider and spinbox
+        """
+        slider = self._create_slider(slider_range, slider_value, tick_interval)
+        
+        spinbox = QDoubleSpinBox()
+        spinbox.setRange(*spinbox_range)
+        spinbox.setValue(spinbox_value)
+        spinbox.setSingleStep(single_step)
+        spinbox.setDecimals(decimals)
+        spinbox.setSuffix(suffix)
+        spinbox.setFixedWidth(spinbox_width)
+        # Typed values are applied on Enter or focus-out, not on every digit
+        spinbox.setKeyboardTracking(False)
+        
+        return self._create_slider_container(label, slider, spinbox), slider, spinbox
+        
+    def _create_linked_int_slider(self, label: str, slider_range: Tuple[int, int], slider_value: int,
+                                  spinbox_range: Tuple[int, int], spinbox_value: int,
+                                  tick_interval: int, spinbox_width: int = 60,
+                                  single_step: int = 1) -> Tuple[QWidget, QSlider, QSpinBox]:
+        """
+        Create a labeled slider with an integer spinbox beside it.
+        
+        Integer counterpart of _create_linked_slider; the caller connects both
+        widgets and syncs them through _sync_peer.
+        
+        Args:
+            label (str): Label text shown above the controls
+            slider_range (Tuple[int, int]): Slider minimum and maximum
+            slider_value (int): Initial slider value
+            spinbox_range (Tuple[int, int]): Spinbox minimum and maximum
+            spinbox_value (int): Initial spinbox value
+            tick_interval (int): Slider tick interval
+            spinbox_width (int): Fixed spinbox width in pixels
+            single_step (int): Spinbox step
+            
+        Returns:
+            Tuple[QWidget, QSlider, QSpinBox]: Container, slider and spinbox
+        """
+        slider = self._create_slider(slider_range, slider_value, tick_interval)
+        
+        spinbox = QSpinBox()
+        spinbox.setRange(*spinbox_range)
+        spinbox.setSingleStep(single_step)
+        spinbox.setValue(spinbox_value)
+        spinbox.setFixedWidth(spinbox_width)
+        # Typed values are applied on Enter or focus-out, not on every digit
+        spinbox.setKeyboardTracking(False)
+        
+        return self._create_slider_container(label, slider, spinbox), slider, spinbox
+        
+    @staticmethod
+    def _create_slider(slider_range: Tuple[int, int], value: int, tick_interval: int) -> QSlider:
+        """
+        Create a horizontal slider with ticks below it.
+        
+        Args:
+            slider_range (Tuple[int, int]): Slider minimum and maximum
+            value (int): Initial slider value
+            tick_interval (int): Slider tick interval
+            
+        Returns:
+            QSlider: Configured slider
+        """
+        slider = QSlider(Qt.Orientation.Horizontal)
+        slider.setRange(*slider_range)
+        slider.setValue(value)
+        slider.setTickPosition(QSlider.TickPosition.TicksBelow)
+        slider.setTickInterval(tick_interval)
+        return slider
+        
+    @staticmethod
+    def _create_slider_container(label: str, slider: QSlider, spinbox: QWidget) -> QWidget:
+        """
+        Place a label above a slider and its spinbox.
+        
+        Args:
+            label (str): Label text
+            slider (QSlider): Slider shown below the label
+            spinbox (QWidget): Spinbox shown beside the slider
+            
+        Returns:
+            QWidget: Container holding the three widgets
+        """
+        # One grid per control, label above and slider beside spinbox, instead
+        # of a row layout nested in a column layout
+        container = QWidget()
+        container_layout = QGridLayout(container)
+        container_layout.addWidget(QLabel(label), 0, 0, 1, 2)
+        container_layout.addWidget(slider, 1, 0)
+        container_layout.addWidget(spinbox, 1, 1)
+        return container
+        
+    def _link_slider_spinbox(self, slider: QSlider, spinbox: QDoubleSpinBox, scale: float,
+                             on_change: Callable[[], None]) -> None:
+        """
+        Keep a slider and spinbox in sync and report each change once.
+        
+        The slider holds the spinbox value multiplied by scale. Each widget
+        mirrors the other through _sync_peer, so a change is reported to
+        on_change exactly once.
+        
+        Args:
+            slider (QSlider): Slider holding the scaled integer value
+            spinbox (QDoubleSpinBox): Spinbox holding the actual value
+            scale (float): Slider units per spinbox unit
+            on_change (Callable[[], None]): Called after either widget changes
+        """
+        def on_slider_changed(value: int) -> None:
+            self._sync_peer(spinbox, value / scale)
+            on_change()
+            
+        def on_spinbox_changed(value: float) -> None:
+            self._sync_peer(slider, int(value * scale))
+            on_change()
+            
+        slider.valueChanged.connect(on_slider_changed)
+        spinbox.valueChanged.connect(on_spinbox_changed)
+        
     def _emit_parameters(self, parameters: Dict[str, Any]) -> None:
         """
         Emit parameters with validation.
         
+        Nothing is emitted when the values equal the last emitted ones, e.g.
+        when a slider tick rounds to the same spinbox value.
+        
         Args:
             parameters (Dict[str, Any]): Parameters to emit
         """
         if not isinstance(parameters, dict):
             logging.error("Parameters must be a dictionary")
             return
+        if parameters == self._last_params:
+            return
+        # Copy, since some views refill the same dictionary in place
+        self._last_params = dict(parameters)
         self.parameters_changed.emit(parameters)
         
+    def _emit_parameters_throttled(self) -> None:
+        """
+        Emit the current parameters at most once per EMIT_THROTTLE_MS.
+        
+        The first change is emitted immediately; changes arriving during the
+        interval are collapsed into one emission of the latest values when it
+        ends. Used for controls such as sliders that fire on every tick.
+        """
+        if self._throttle_timer.isActive():
+            self._emit_pending = True
+            return
+        self._emit_parameters(self.get_parameters())
+        self._throttle_timer.start()
+        
+    def flush_pending_parameters(self) -> None:
+        """
+        Emit a throttled change now instead of at the end of the interval.
+        
+        Called before processing starts, so a control moved just before the
+        click is applied before the processor reads its parameters.
+        """
+        if self._emit_pending:
+            self._emit_pending = False
+            self._throttle_timer.stop()
+            self._emit_parameters(self.get_parameters())
+        
+    def _on_throttle_timeout(self) -> None:
+        """Emit the changes collected during the last throttle interval."""
+        if self._emit_pending:
+            self._emit_pending = False
+            self._emit_parameters(self.get_parameters())
+            self._throttle_timer.start()
+        
+    @staticmethod
+    def _sync_peer(widget: QWidget, value: Any) -> None:
+        """
+        Mirror a value into the paired slider or spinbox without re-entering its handler.
+        
+        Args:
+            widget (QWidget): Slider or spinbox paired with the changed control
+            value (Any): Value to show
+        """
+        if widget.value() == value:
+            return
+        # The caller emits the parameters once; the peer's handler must not
+        with QSignalBlocker(widget):
+            widget.setValue(value)
+        
+    @contextmanager
+    def _signals_blocked(self, *widgets: QWidget) -> Iterator[None]:
+        """
+        Block the given widgets' signals for the duration of the block.
+        
+        Used by reset() so restoring each default does not emit on its own;
+        the caller emits the parameters once afterwards.
+        
+        Args:
+            *widgets (QWidget): Controls to silence
+        """
+        blockers = [QSignalBlocker(widget) for widget in widgets]
+        try:
+            yield
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+        
     def get_parameters(self) -> Dict[str, Any]:
         """
         Get current parameters from the view.
@@ -111,21 +338,20 @@ class BaseProcessorView(QWidget):
         Clean up resources before deletion.
         
         This method should be called before the view is destroyed
-        to properly disconnect signals and free resources.
+        to properly disconnect signals and free resources. There is no
+        destructor fallback: MainWindowView.cleanup calls it for every
+        processor view that was created.
         """
-        # Disconnect all signals
-        try:
+        self._throttle_timer.stop()
+        self._emit_pending = False
+        
+        # Disconnect all signals; disconnect() raises if nothing is connected
+        if self.receivers(self.parameters_changed) > 0:
             self.parameters_changed.disconnect()
-        except Exception as e:
-            logging.debug(f"Error disconnecting signals: {e}")
             
         # Clear layout
         while self.layout.count():
             item = self.layout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
-                
-    def __del__(self) -> None:
-        """Destructor to ensure cleanup."""
-        self.cleanup() 
-        
\ No newline at end of file
+
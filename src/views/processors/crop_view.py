@@ -1,13 +1,53 @@
+from typing import Tuple, Union
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import pyqtSignal, pyqtSlot, QTimer
+from PyQt6.QtGui import QIntValidator
 from views.components.base_input import TextInput
 from views.components.error_message import ErrorMessage
 
+def _parse_and_validate(x1: str, x2: str, y1: str, y2: str) -> Tuple[bool, Union[Tuple[int, int, int, int], str]]:
+    """
+    Parse and validate crop coordinate texts.
+    
+    Args:
+        x1 (str): Left coordinate text
+        x2 (str): Right coordinate text
+        y1 (str): Top coordinate text
+        y2 (str): Bottom coordinate text
+        
+    Returns:
+        Tuple[bool, Union[Tuple[int, int, int, int], str]]: (True, (x1, x2, y1, y2))
+        when valid, otherwise (False, error message)
+    """
+    # Check the texts first so partial input is rejected without raising
+    if not all(text.isdecimal() for text in (x1, x2, y1, y2)):
+        return False, "Please enter valid numbers"
+    coords = (int(x1), int(x2), int(y1), int(y2))
+    
+    # Check if coordinates form a valid rectangle
+    if coords[0] >= coords[1]:
+        return False, "X1 must be less than X2"
+        
+    if coords[2] >= coords[3]:
+        return False, "Y1 must be less than Y2"
+        
+    return True, coords
+
 class CropView(QWidget):
     parameters_changed = pyqtSignal(dict)
     
+    MAX_COORDINATE = 1_000_000
+    EMIT_DELAY_MS = 150  # Quiet period after the last keystroke before emitting
+    
     def __init__(self):
         super().__init__()
+        # Coalesce a burst of keystrokes into a single validation and emission
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(self.EMIT_DELAY_MS)
+        self._emit_timer.timeout.connect(self._on_parameters_settled)
+        # Filled in place by get_parameters; receivers copy the values out
+        self._params = {"x1": 0, "x2": 0, "y1": 0, "y2": 0}
         self._setup_ui()
         
     def _setup_ui(self):
@@ -43,41 +83,38 @@ class CropView(QWidget):
         self.error_message = ErrorMessage()
         layout.addWidget(self.error_message)
         
-        # Connect signals
-        self.x1_input.textChanged.connect(self._on_parameter_changed)
-        self.x2_input.textChanged.connect(self._on_parameter_changed)
-        self.y1_input.textChanged.connect(self._on_parameter_changed)
-        self.y2_input.textChanged.connect(self._on_parameter_changed)
+        # Only digits can be typed, so int() fails only on empty fields
+        for coord_input in (self.x1_input, self.x2_input, self.y1_input, self.y2_input):
+            coord_input.input.setValidator(QIntValidator(0, self.MAX_COORDINATE, self))
+            coord_input.textChanged.connect(self._on_parameter_changed)
+            # Leaving a field (e.g. to click Process) applies a pending edit at once
+            coord_input.input.editingFinished.connect(self.flush_pending_parameters)
+        
+    def _get_input_texts(self) -> tuple:
+        return (self.x1_input.get_value(), self.x2_input.get_value(),
+                self.y1_input.get_value(), self.y2_input.get_value())
         
     def _validate_coordinates(self) -> bool:
-        try:
-            x1 = int(self.x1_input.get_value())
-            x2 = int(self.x2_input.get_value())
-            y1 = int(self.y1_input.get_value())
-            y2 = int(self.y2_input.get_value())
-            
-            # Check if coordinates are positive
-            if any(coord < 0 for coord in [x1, x2, y1, y2]):
-                self.error_message.show_message("Coordinates must be positive numbers")
-                return False
-                
-            # Check if coordinates form a valid rectangle
-            if x1 >= x2:
-                self.error_message.show_message("X1 must be less than X2")
-                return False
-                
-            if y1 >= y2:
-                self.error_message.show_message("Y1 must be less than Y2")
-                return False
-                
-            self.error_message.clear_message()
-            return True
-            
-        except ValueError:
-            self.error_message.show_message("Please enter valid numbers")
+        valid, result = _parse_and_validate(*self._get_input_texts())
+        if not valid:
+            self.error_message.show_message(result)
             return False
             
+        self.error_message.clear_message()
+        return True
+            
+    @pyqtSlot()
     def _on_parameter_changed(self):
+        self._emit_timer.start()
+        
+    @pyqtSlot()
+    def flush_pending_parameters(self):
+        if self._emit_timer.isActive():
+            self._emit_timer.stop()
+            self._on_parameters_settled()
+            
+    @pyqtSlot()
+    def _on_parameters_settled(self):
         if self._validate_coordinates():
             self._emit_parameters()
             
@@ -86,24 +123,19 @@ class CropView(QWidget):
         self.parameters_changed.emit(parameters)
         
     def get_parameters(self) -> dict:
+        params = self._params
         try:
-            return {
-                "x1": int(self.x1_input.get_value()),
-                "x2": int(self.x2_input.get_value()),
-                "y1": int(self.y1_input.get_value()),
-                "y2": int(self.y2_input.get_value())
-            }
+            values = [int(text) for text in self._get_input_texts()]
         except ValueError:
-            return {
-                "x1": 0,
-                "x2": 0,
-                "y1": 0,
-                "y2": 0
-            }
+            values = (0, 0, 0, 0)
+        params["x1"], params["x2"], params["y1"], params["y2"] = values
+        return params
             
     def reset(self):
         self.x1_input.set_value("0")
         self.x2_input.set_value("0")
         self.y1_input.set_value("0")
         self.y2_input.set_value("0")
+        # Programmatic reset is not an edit; drop the validation it scheduled
+        self._emit_timer.stop()
         self.error_message.clear_message() 
\ No newline at end of file
@@ -1,5 +1,5 @@
 from PyQt6.QtWidgets import QLabel, QRadioButton, QButtonGroup
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
 from .base_processor_view import BaseProcessorView
 
 class FlipView(BaseProcessorView):
@@ -7,6 +7,8 @@ class FlipView(BaseProcessorView):
     
     def __init__(self):
         super().__init__("Flip")
+        # Updated in place by get_parameters; receivers copy the value out
+        self._params = {"flip_type": 0}
         self._setup_flip_ui()
         
     def _setup_flip_ui(self):
@@ -24,39 +26,36 @@ class FlipView(BaseProcessorView):
         
         # Create button group
         self.button_group = QButtonGroup(self)  # Set parent to self
-        self.button_group.addButton(self.vertical_radio)
-        self.button_group.addButton(self.horizontal_radio)
-        self.button_group.buttonClicked.connect(self._on_flip_type_changed)
+        # Button ids are the flip types, so idClicked delivers the value directly
+        self.button_group.addButton(self.vertical_radio, 0)
+        self.button_group.addButton(self.horizontal_radio, 1)
+        self._flip_connection = self.button_group.idClicked.connect(self._on_flip_type_changed)
         
         # Add radio buttons to layout
         radio_layout.addWidget(self.vertical_radio)
         radio_layout.addWidget(self.horizontal_radio)
         
-    def _on_flip_type_changed(self, button):
-        flip_type = 0 if button == self.vertical_radio else 1
+    @pyqtSlot(int)
+    def _on_flip_type_changed(self, flip_type: int):
         self.flip_type_changed.emit(flip_type)
         self._on_parameter_changed()
         
+    @pyqtSlot()
     def _on_parameter_changed(self):
         parameters = self.get_parameters()
         self._emit_parameters(parameters)
         
     def get_parameters(self) -> dict:
-        return {
-            "flip_type": 0 if self.vertical_radio.isChecked() else 1
-        }
+        self._params["flip_type"] = self.button_group.checkedId()
+        return self._params
         
     def reset(self):
         self.vertical_radio.setChecked(True)
         
     def cleanup(self):
-        if hasattr(self, 'button_group'):
-            try:
-                self.button_group.buttonClicked.disconnect()
-            except:
-                pass
-        try:
+        if self._flip_connection is not None:
+            self.button_group.idClicked.disconnect(self._flip_connection)
+            self._flip_connection = None
+        if self.receivers(self.flip_type_changed) > 0:
             self.flip_type_changed.disconnect()
-        except:
-            pass
         super().cleanup() 
\ No newline at end of file
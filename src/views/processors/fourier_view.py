@@ -1,7 +1,7 @@
 from typing import Dict, Any
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                            QSlider, QDoubleSpinBox, QComboBox, QCheckBox, QSpinBox, QGroupBox)
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QCheckBox, QSpinBox,
+                            QGroupBox)
+from PyQt6.QtCore import pyqtSlot
 from views.processors.base_processor_view import BaseProcessorView
 
 class FourierView(BaseProcessorView):
@@ -12,11 +12,45 @@ class FourierView(BaseProcessorView):
     operation mode, filter types, cutoff frequencies, and visualization options.
     """
     
+    # Map display names to internal parameter names; the combo boxes list the
+    # names in this order, so a combo index also indexes the *_VALUES tuples
+    OPERATION_MAP = {
+        "Frequency Filter": "filter",
+        "Magnitude Spectrum": "magnitude", 
+        "Phase Spectrum": "phase",
+        "Inverse FFT": "inverse"
+    }
+    
+    FILTER_TYPE_MAP = {
+        "Lowpass": "lowpass",
+        "Highpass": "highpass",
+        "Bandpass": "bandpass", 
+        "Notch": "notch"
+    }
+    
+    FILTER_SHAPE_MAP = {
+        "Gaussian": "gaussian",
+        "Ideal": "ideal",
+        "Butterworth": "butterworth"
+    }
+    
+    OPERATION_VALUES = tuple(OPERATION_MAP.values())
+    FILTER_TYPE_VALUES = tuple(FILTER_TYPE_MAP.values())
+    FILTER_SHAPE_VALUES = tuple(FILTER_SHAPE_MAP.values())
+    
     def __init__(self) -> None:
         """Initialize the Fourier transform view."""
         super().__init__("Fourier Transform")
+        # Refilled in place by get_parameters; receivers copy the values out
+        self._params: Dict[str, Any] = {}
+        
         self._setup_controls()
         
+        # Selections the visibility handlers last applied, so repeats are skipped
+        self._last_operation = self.operation_combo.currentText()
+        self._last_filter_type = self.filter_type_combo.currentText()
+        self._last_filter_shape = self.filter_shape_combo.currentText()
+        
     def _setup_controls(self) -> None:
         """Set up all control widgets."""
         self._setup_operation_control()
@@ -30,14 +64,7 @@ class FourierView(BaseProcessorView):
         operation_group = QGroupBox("Operation Type")
         operation_layout = QVBoxLayout(operation_group)
         
-        operations = [
-            "Frequency Filter",
-            "Magnitude Spectrum", 
-            "Phase Spectrum",
-            "Inverse FFT"
-        ]
-        
-        self.operation_combo = self._create_combobox("Mode:", operations)
+        self.operation_combo = self._create_combobox("Mode:", list(self.OPERATION_MAP))
         self.operation_combo.setCurrentText("Frequency Filter")
         self.operation_combo.currentTextChanged.connect(self._on_operation_changed)
         
@@ -50,14 +77,7 @@ class FourierView(BaseProcessorView):
         filter_layout = QVBoxLayout(self.filter_group)
         
         # Filter type selection
-        filter_types = [
-            "Lowpass",
-            "Highpass", 
-            "Bandpass",
-            "Notch"
-        ]
-        
-        self.filter_type_combo = self._create_combobox("Filter Type:", filter_types)
+        self.filter_type_combo = self._create_combobox("Filter Type:", list(self.FILTER_TYPE_MAP))
         self.filter_type_combo.setCurrentText("Lowpass")
         self.filter_type_combo.currentTextChanged.connect(self._on_filter_type_changed)
         filter_layout.addWidget(self.filter_type_combo)
@@ -70,65 +90,16 @@ class FourierView(BaseProcessorView):
         frequency_layout = QVBoxLayout(self.frequency_group)
         
         # Primary cutoff frequency
-        cutoff_container = QWidget()
-        cutoff_layout = QVBoxLayout(cutoff_container)
-        
-        cutoff_label = QLabel("Cutoff Frequency (% of max):")
-        cutoff_layout.addWidget(cutoff_label)
-        
-        cutoff_slider_layout = QHBoxLayout()
-        
-        self.cutoff_slider = QSlider(Qt.Orientation.Horizontal)
-        self.cutoff_slider.setMinimum(1)
-        self.cutoff_slider.setMaximum(100)
-        self.cutoff_slider.setValue(50)
-        self.cutoff_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
-        self.cutoff_slider.setTickInterval(10)
-        
-        self.cutoff_spinbox = QDoubleSpinBox()
-        self.cutoff_spinbox.setMinimum(0.1)
-        self.cutoff_spinbox.setMaximum(100.0)
-        self.cutoff_spinbox.setValue(50.0)
-        self.cutoff_spinbox.setSingleStep(1.0)
-        self.cutoff_spinbox.setDecimals(1)
-        self.cutoff_spinbox.setSuffix(" %")
-        self.cutoff_spinbox.setFixedWidth(100)
-        
-        cutoff_slider_layout.addWidget(self.cutoff_slider)
-        cutoff_slider_layout.addWidget(self.cutoff_spinbox)
-        cutoff_layout.addLayout(cutoff_slider_layout)
-        
+        cutoff_container, self.cutoff_slider, self.cutoff_spinbox = self._create_linked_slider(
+            "Cutoff Frequency (% of max):", (1, 100), 50, (0.1, 100.0), 50.0,
+            tick_interval=10, suffix=" %", spinbox_width=100)
         frequency_layout.addWidget(cutoff_container)
         
         # High cutoff frequency (for bandpass/notch)
-        self.cutoff_high_container = QWidget()
-        cutoff_high_layout = QVBoxLayout(self.cutoff_high_container)
-        
-        cutoff_high_label = QLabel("High Cutoff Frequency (% of max):")
-        cutoff_high_layout.addWidget(cutoff_high_label)
-        
-        cutoff_high_slider_layout = QHBoxLayout()
-        
-        self.cutoff_high_slider = QSlider(Qt.Orientation.Horizontal)
-        self.cutoff_high_slider.setMinimum(1)
-        self.cutoff_high_slider.setMaximum(100)
-        self.cutoff_high_slider.setValue(80)
-        self.cutoff_high_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
-        self.cutoff_high_slider.setTickInterval(10)
-        
-        self.cutoff_high_spinbox = QDoubleSpinBox()
-        self.cutoff_high_spinbox.setMinimum(0.1)
-        self.cutoff_high_spinbox.setMaximum(100.0)
-        self.cutoff_high_spinbox.setValue(80.0)
-        self.cutoff_high_spinbox.setSingleStep(1.0)
-        self.cutoff_high_spinbox.setDecimals(1)
-        self.cutoff_high_spinbox.setSuffix(" %")
-        self.cutoff_high_spinbox.setFixedWidth(100)
-        
-        cutoff_high_slider_layout.addWidget(self.cutoff_high_slider)
-        cutoff_high_slider_layout.addWidget(self.cutoff_high_spinbox)
-        cutoff_high_layout.addLayout(cutoff_high_slider_layout)
-        
+        (self.cutoff_high_container, self.cutoff_high_slider,
+         self.cutoff_high_spinbox) = self._create_linked_slider(
+            "High Cutoff Frequency (% of max):", (1, 100), 80, (0.1, 100.0), 80.0,
+            tick_interval=10, suffix=" %", spinbox_width=100)
         frequency_layout.addWidget(self.cutoff_high_container)
         
         # Connect frequency controls
@@ -148,13 +119,7 @@ class FourierView(BaseProcessorView):
         shape_layout = QVBoxLayout(self.shape_group)
         
         # Filter shape selection
-        filter_shapes = [
-            "Gaussian",
-            "Ideal",
-            "Butterworth"
-        ]
-        
-        self.filter_shape_combo = self._create_combobox("Shape:", filter_shapes)
+        self.filter_shape_combo = self._create_combobox("Shape:", list(self.FILTER_SHAPE_MAP))
         self.filter_shape_combo.setCurrentText("Gaussian")
         self.filter_shape_combo.currentTextChanged.connect(self._on_filter_shape_changed)
         shape_layout.addWidget(self.filter_shape_combo)
@@ -171,38 +136,15 @@ class FourierView(BaseProcessorView):
         self.butterworth_spinbox.setMaximum(10)
         self.butterworth_spinbox.setValue(2)
         self.butterworth_spinbox.setSuffix(" (steepness)")
+        self.butterworth_spinbox.setKeyboardTracking(False)
         
         butterworth_layout.addWidget(self.butterworth_spinbox)
         shape_layout.addWidget(self.butterworth_container)
         
-        # Gaussian sigma control
-        self.gaussian_container = QWidget()
-        gaussian_layout = QVBoxLayout(self.gaussian_container)
-        
-        gaussian_label = QLabel("Gaussian Sigma:")
-        gaussian_layout.addWidget(gaussian_label)
-        
-        gaussian_slider_layout = QHBoxLayout()
-        
-        self.gaussian_slider = QSlider(Qt.Orientation.Horizontal)
-        self.gaussian_slider.setMinimum(10)  # 1.0
-        self.gaussian_slider.setMaximum(1000)  # 100.0
-        self.gaussian_slider.setValue(200)  # Default 20.0
-        self.gaussian_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
-        self.gaussian_slider.setTickInterval(100)
-        
-        self.gaussian_spinbox = QDoubleSpinBox()
-        self.gaussian_spinbox.setMinimum(1.0)
-        self.gaussian_spinbox.setMaximum(100.0)
-        self.gaussian_spinbox.setValue(20.0)
-        self.gaussian_spinbox.setSingleStep(1.0)
-        self.gaussian_spinbox.setDecimals(1)
-        self.gaussian_spinbox.setFixedWidth(80)
-        
-        gaussian_slider_layout.addWidget(self.gaussian_slider)
-        gaussian_slider_layout.addWidget(self.gaussian_spinbox)
-        gaussian_layout.addLayout(gaussian_slider_layout)
-        
+        # Gaussian sigma control; the slider works in tenths (10-1000 for 1.0-100.0)
+        self.gaussian_container, self.gaussian_slider, self.gaussian_spinbox = self._create_linked_slider(
+            "Gaussian Sigma:", (10, 1000), 200, (1.0, 100.0), 20.0,
+            tick_interval=100, spinbox_width=80)
         shape_layout.addWidget(self.gaussian_container)
         
         # Connect shape controls
@@ -236,137 +178,155 @@ class FourierView(BaseProcessorView):
         
         self.layout.addWidget(viz_group)
         
+    @pyqtSlot(str)
     def _on_operation_changed(self, operation: str) -> None:
         """Handle operation type selection changes."""
+        if operation == self._last_operation:
+            return
+        self._last_operation = operation
+        
         # Show/hide filter controls based on operation type
         is_filter_mode = (operation == "Frequency Filter")
         
-        self.filter_group.setVisible(is_filter_mode)
-        self.frequency_group.setVisible(is_filter_mode)
-        self.shape_group.setVisible(is_filter_mode)
+        # Repaint once after all three groups change; reset() may already
+        # have suspended painting, so restore the previous state
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            self.filter_group.setVisible(is_filter_mode)
+            self.frequency_group.setVisible(is_filter_mode)
+            self.shape_group.setVisible(is_filter_mode)
+        finally:
+            self.setUpdatesEnabled(updates_enabled)
         
         self._on_parameters_changed()
         
+    @pyqtSlot(str)
     def _on_filter_type_changed(self, filter_type: str) -> None:
         """Handle filter type selection changes."""
+        if filter_type == self._last_filter_type:
+            return
+        self._last_filter_type = filter_type
+        
         # Show/hide high cutoff for bandpass/notch filters
         needs_high_cutoff = filter_type in ["Bandpass", "Notch"]
         self.cutoff_high_container.setVisible(needs_high_cutoff)
         
         self._on_parameters_changed()
         
+    @pyqtSlot(str)
     def _on_filter_shape_changed(self, shape: str) -> None:
         """Handle filter shape selection changes."""
+        if shape == self._last_filter_shape:
+            return
+        self._last_filter_shape = shape
+        
         # Show/hide shape-specific controls
         self.butterworth_container.setVisible(shape == "Butterworth")
         self.gaussian_container.setVisible(shape == "Gaussian")
         
         self._on_parameters_changed()
         
+    @pyqtSlot(int)
     def _on_cutoff_slider_changed(self, value: int) -> None:
         """Handle cutoff frequency slider changes."""
-        cutoff_value = float(value)
-        self.cutoff_spinbox.setValue(cutoff_value)
-        self._on_parameters_changed()
+        self._sync_peer(self.cutoff_spinbox, float(value))
+        self._emit_parameters_throttled()
         
+    @pyqtSlot(float)
     def _on_cutoff_spinbox_changed(self, value: float) -> None:
         """Handle cutoff frequency spinbox changes."""
-        slider_value = int(value)
-        self.cutoff_slider.setValue(slider_value)
-        self._on_parameters_changed()
+        self._sync_peer(self.cutoff_slider, int(value))
+        self._emit_parameters_throttled()
         
+    @pyqtSlot(int)
     def _on_cutoff_high_slider_changed(self, value: int) -> None:
         """Handle high cutoff frequency slider changes."""
-        cutoff_high_value = float(value)
-        self.cutoff_high_spinbox.setValue(cutoff_high_value)
-        self._on_parameters_changed()
+        self._sync_peer(self.cutoff_high_spinbox, float(value))
+        self._emit_parameters_throttled()
         
+    @pyqtSlot(float)
     def _on_cutoff_high_spinbox_changed(self, value: float) -> None:
         """Handle high cutoff frequency spinbox changes."""
-        slider_value = int(value)
-        self.cutoff_high_slider.setValue(slider_value)
-        self._on_parameters_changed()
+        self._sync_peer(self.cutoff_high_slider, int(value))
+        self._emit_parameters_throttled()
         
+    @pyqtSlot(int)
     def _on_gaussian_slider_changed(self, value: int) -> None:
         """Handle Gaussian sigma slider changes."""
-        gaussian_value = value / 10.0  # Convert to 1.0-100.0 range
-        self.gaussian_spinbox.setValue(gaussian_value)
-        self._on_parameters_changed()
+        self._sync_peer(self.gaussian_spinbox, value / 10.0)  # Convert to 1.0-100.0 range
+        self._emit_parameters_throttled()
         
+    @pyqtSlot(float)
     def _on_gaussian_spinbox_changed(self, value: float) -> None:
         """Handle Gaussian sigma spinbox changes."""
-        slider_value = int(value * 10)  # Convert to 10-1000 range
-        self.gaussian_slider.setValue(slider_value)
-        self._on_parameters_changed()
+        self._sync_peer(self.gaussian_slider, int(value * 10))  # Convert to 10-1000 range
+        self._emit_parameters_throttled()
         
+    @pyqtSlot()
     def _on_parameters_changed(self) -> None:
         """Handle any parameter change."""
-        parameters = self.get_parameters()
-        self._emit_parameters(parameters)
+        # Shares the slider throttle, so a selection change that also toggles
+        # visibility is reported together with the values moved alongside it
+        self._emit_parameters_throttled()
         
     def get_parameters(self) -> Dict[str, Any]:
         """
         Get current parameters from the view.
         
+        The same dictionary is refilled and returned on every call.
+        
         Returns:
             Dict[str, Any]: Current parameter values
         """
-        # Map display names to internal names
-        operation_map = {
-            "Frequency Filter": "filter",
-            "Magnitude Spectrum": "magnitude", 
-            "Phase Spectrum": "phase",
-            "Inverse FFT": "inverse"
-        }
-        
-        filter_type_map = {
-            "Lowpass": "lowpass",
-            "Highpass": "highpass",
-            "Bandpass": "bandpass", 
-            "Notch": "notch"
-        }
-        
-        filter_shape_map = {
-            "Gaussian": "gaussian",
-            "Ideal": "ideal",
-            "Butterworth": "butterworth"
-        }
-        
-        return {
-            "operation_type": operation_map[self.operation_combo.currentText()],
-            "filter_type": filter_type_map[self.filter_type_combo.currentText()],
-            "filter_shape": filter_shape_map[self.filter_shape_combo.currentText()],
-            "cutoff_frequency": self.cutoff_spinbox.value(),
-            "cutoff_high": self.cutoff_high_spinbox.value(),
-            "butterworth_order": self.butterworth_spinbox.value(),
-            "gaussian_sigma": self.gaussian_spinbox.value(),
-            "show_spectrum": self.show_spectrum_checkbox.isChecked(),
-            "log_transform": self.log_transform_checkbox.isChecked()
-        }
+        params = self._params
+        params["operation_type"] = self.OPERATION_VALUES[self.operation_combo.currentIndex()]
+        params["filter_type"] = self.FILTER_TYPE_VALUES[self.filter_type_combo.currentIndex()]
+        params["filter_shape"] = self.FILTER_SHAPE_VALUES[self.filter_shape_combo.currentIndex()]
+        params["cutoff_frequency"] = self.cutoff_spinbox.value()
+        params["cutoff_high"] = self.cutoff_high_spinbox.value()
+        params["butterworth_order"] = self.butterworth_spinbox.value()
+        params["gaussian_sigma"] = self.gaussian_spinbox.value()
+        params["show_spectrum"] = self.show_spectrum_checkbox.isChecked()
+        params["log_transform"] = self.log_transform_checkbox.isChecked()
+        return params
         
     def reset(self) -> None:
         """Reset view to initial state."""
-        # Reset to default values
-        self.operation_combo.setCurrentText("Frequency Filter")
-        self.filter_type_combo.setCurrentText("Lowpass")
-        self.filter_shape_combo.setCurrentText("Gaussian")
-        
-        self.cutoff_slider.setValue(50)
-        self.cutoff_spinbox.setValue(50.0)
-        self.cutoff_high_slider.setValue(80)
-        self.cutoff_high_spinbox.setValue(80.0)
-        
-        self.butterworth_spinbox.setValue(2)
-        self.gaussian_slider.setValue(200)
-        self.gaussian_spinbox.setValue(20.0)
-        
-        self.show_spectrum_checkbox.setChecked(True)
-        self.log_transform_checkbox.setChecked(True)
-        
-        # Update visibility
-        self._on_operation_changed("Frequency Filter")
-        self._on_filter_type_changed("Lowpass")
-        self._on_filter_shape_changed("Gaussian")
-        
-        # Emit parameters after reset
-        self._on_parameters_changed() 
\ No newline at end of file
+        # Suspend painting so the whole reset is drawn in a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            # Reset to default values without emitting once per control
+            with self._signals_blocked(
+                self.operation_combo, self.filter_type_combo, self.filter_shape_combo,
+                self.cutoff_slider, self.cutoff_spinbox,
+                self.cutoff_high_slider, self.cutoff_high_spinbox,
+                self.butterworth_spinbox, self.gaussian_slider, self.gaussian_spinbox,
+                self.show_spectrum_checkbox, self.log_transform_checkbox
+            ):
+                self.operation_combo.setCurrentText("Frequency Filter")
+                self.filter_type_combo.setCurrentText("Lowpass")
+                self.filter_shape_combo.setCurrentText("Gaussian")
+            
+                self.cutoff_slider.setValue(50)
+                self.cutoff_spinbox.setValue(50.0)
+                self.cutoff_high_slider.setValue(80)
+                self.cutoff_high_spinbox.setValue(80.0)
+            
+                self.butterworth_spinbox.setValue(2)
+                self.gaussian_slider.setValue(200)
+                self.gaussian_spinbox.setValue(20.0)
+            
+                self.show_spectrum_checkbox.setChecked(True)
+                self.log_transform_checkbox.setChecked(True)
+        
+            # Update visibility
+            self._on_operation_changed("Frequency Filter")
+            self._on_filter_type_changed("Lowpass")
+            self._on_filter_shape_changed("Gaussian")
+        finally:
+            self.setUpdatesEnabled(True)
+        
+        # Emit parameters after reset; skipped if the visibility updates
+        # above already reported these values
+        self._emit_parameters(self.get_parameters())
@@ -1,7 +1,5 @@
 from typing import Dict, Any
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                            QSlider, QDoubleSpinBox, QComboBox, QCheckBox, QSpinBox)
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QCheckBox, QSpinBox
 from views.processors.base_processor_view import BaseProcessorView
 
 class HighpassView(BaseProcessorView):
@@ -12,20 +10,39 @@ class HighpassView(BaseProcessorView):
     filter type, strength, and algorithm-specific settings.
     """
     
+    # Map display names to internal parameter names
+    FILTER_TYPE_MAP = {
+        "Unsharp Mask": "unsharp_mask",
+        "Laplacian": "laplacian",
+        "High Boost": "high_boost",
+        "Custom Kernel": "custom"
+    }
+    
+    # Values reported for controls that have not been built yet
+    DEFAULT_BOOST_FACTOR = 1.5
+    DEFAULT_KERNEL_SIZE = 3
+    
     def __init__(self) -> None:
         """Initialize the highpass filter view."""
         super().__init__("Highpass Filter")
+        # Refilled in place by get_parameters; receivers copy the values out
+        self._params: Dict[str, Any] = {}
         self._setup_controls()
         
+        # Filter type the visibility handler last applied, so repeats are skipped
+        self._last_filter_type = self.filter_type_combo.currentText()
+        
     def _setup_controls(self) -> None:
         """Set up all control widgets."""
         self._setup_filter_type_control()
         self._setup_strength_control()
         self._setup_gaussian_control()
-        self._setup_boost_factor_control()
-        self._setup_kernel_size_control()
         self._setup_options()
         
+        # Built on first use, since only one filter type needs each of them
+        self.boost_container = None
+        self.kernel_container = None
+        
     def _setup_filter_type_control(self) -> None:
         """Set up filter type selection."""
         filter_types = [
@@ -41,111 +58,41 @@ class HighpassView(BaseProcessorView):
         
     def _setup_strength_control(self) -> None:
         """Set up filter strength control."""
-        strength_container = QWidget()
-        strength_layout = QVBoxLayout(strength_container)
-        
-        strength_label = QLabel("Filter Strength:")
-        strength_layout.addWidget(strength_label)
-        
-        strength_slider_layout = QHBoxLayout()
-        
-        self.strength_slider = QSlider(Qt.Orientation.Horizontal)
-        self.strength_slider.setMinimum(0)
-        self.strength_slider.setMaximum(500)  # 0.0 to 5.0 with 0.01 precision
-        self.strength_slider.setValue(100)  # Default 1.0
-        self.strength_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
-        self.strength_slider.setTickInterval(100)
-        
-        self.strength_spinbox = QDoubleSpinBox()
-        self.strength_spinbox.setMinimum(0.0)
-        self.strength_spinbox.setMaximum(5.0)
-        self.strength_spinbox.setValue(1.0)
-        self.strength_spinbox.setSingleStep(0.1)
-        self.strength_spinbox.setDecimals(2)
-        self.strength_spinbox.setFixedWidth(80)
-        
-        strength_slider_layout.addWidget(self.strength_slider)
-        strength_slider_layout.addWidget(self.strength_spinbox)
-        strength_layout.addLayout(strength_slider_layout)
-        
+        # Slider works in hundredths: 0-500 for 0.0-5.0
+        strength_container, self.strength_slider, self.strength_spinbox = self._create_linked_slider(
+            "Filter Strength:", (0, 500), 100, (0.0, 5.0), 1.0,
+            tick_interval=100, spinbox_width=80, decimals=2, single_step=0.1)
         self.layout.addWidget(strength_container)
         
         # Connect strength controls
-        self.strength_slider.valueChanged.connect(self._on_strength_slider_changed)
-        self.strength_spinbox.valueChanged.connect(self._on_strength_spinbox_changed)
+        self._link_slider_spinbox(self.strength_slider, self.strength_spinbox, 100,
+                                  self._emit_parameters_throttled)
         
     def _setup_gaussian_control(self) -> None:
         """Set up Gaussian sigma control for unsharp mask and high boost."""
-        self.gaussian_container = QWidget()
-        gaussian_layout = QVBoxLayout(self.gaussian_container)
-        
-        gaussian_label = QLabel("Gaussian Sigma (Blur Amount):")
-        gaussian_layout.addWidget(gaussian_label)
-        
-        gaussian_slider_layout = QHBoxLayout()
-        
-        self.gaussian_slider = QSlider(Qt.Orientation.Horizontal)
-        self.gaussian_slider.setMinimum(10)  # 0.1
-        self.gaussian_slider.setMaximum(1000)  # 10.0
-        self.gaussian_slider.setValue(100)  # Default 1.0
-        self.gaussian_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
-        self.gaussian_slider.setTickInterval(100)
-        
-        self.gaussian_spinbox = QDoubleSpinBox()
-        self.gaussian_spinbox.setMinimum(0.1)
-        self.gaussian_spinbox.setMaximum(10.0)
-        self.gaussian_spinbox.setValue(1.0)
-        self.gaussian_spinbox.setSingleStep(0.1)
-        self.gaussian_spinbox.setDecimals(2)
-        self.gaussian_spinbox.setFixedWidth(80)
-        
-        gaussian_slider_layout.addWidget(self.gaussian_slider)
-        gaussian_slider_layout.addWidget(self.gaussian_spinbox)
-        gaussian_layout.addLayout(gaussian_slider_layout)
-        
+        # Slider works in hundredths: 10-1000 for 0.1-10.0
+        self.gaussian_container, self.gaussian_slider, self.gaussian_spinbox = self._create_linked_slider(
+            "Gaussian Sigma (Blur Amount):", (10, 1000), 100, (0.1, 10.0), 1.0,
+            tick_interval=100, spinbox_width=80, decimals=2, single_step=0.1)
         self.layout.addWidget(self.gaussian_container)
         
         # Connect gaussian controls
-        self.gaussian_slider.valueChanged.connect(self._on_gaussian_slider_changed)
-        self.gaussian_spinbox.valueChanged.connect(self._on_gaussian_spinbox_changed)
+        self._link_slider_spinbox(self.gaussian_slider, self.gaussian_spinbox, 100,
+                                  self._emit_parameters_throttled)
         
     def _setup_boost_factor_control(self) -> None:
         """Set up boost factor control for high boost filter."""
-        self.boost_container = QWidget()
-        boost_layout = QVBoxLayout(self.boost_container)
-        
-        boost_label = QLabel("Boost Factor:")
-        boost_layout.addWidget(boost_label)
-        
-        boost_slider_layout = QHBoxLayout()
-        
-        self.boost_slider = QSlider(Qt.Orientation.Horizontal)
-        self.boost_slider.setMinimum(100)  # 1.0
-        self.boost_slider.setMaximum(500)  # 5.0
-        self.boost_slider.setValue(150)  # Default 1.5
-        self.boost_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
-        self.boost_slider.setTickInterval(100)
-        
-        self.boost_spinbox = QDoubleSpinBox()
-        self.boost_spinbox.setMinimum(1.0)
-        self.boost_spinbox.setMaximum(5.0)
-        self.boost_spinbox.setValue(1.5)
-        self.boost_spinbox.setSingleStep(0.1)
-        self.boost_spinbox.setDecimals(2)
-        self.boost_spinbox.setFixedWidth(80)
-        
-        boost_slider_layout.addWidget(self.boost_slider)
-        boost_slider_layout.addWidget(self.boost_spinbox)
-        boost_layout.addLayout(boost_slider_layout)
-        
-        self.layout.addWidget(self.boost_container)
+        # Slider works in hundredths: 100-500 for 1.0-5.0
+        self.boost_container, self.boost_slider, self.boost_spinbox = self._create_linked_slider(
+            "Boost Factor:", (100, 500), 150, (1.0, 5.0), 1.5,
+            tick_interval=100, spinbox_width=80, decimals=2, single_step=0.1)
+        # Sits directly below the gaussian control
+        index = self.layout.indexOf(self.gaussian_container) + 1
+        self.layout.insertWidget(index, self.boost_container)
         
         # Connect boost controls
-        self.boost_slider.valueChanged.connect(self._on_boost_slider_changed)
-        self.boost_spinbox.valueChanged.connect(self._on_boost_spinbox_changed)
-        
-        # Initially hide boost factor (only shown for high boost filter)
-        self.boost_container.setVisible(False)
+        self._link_slider_spinbox(self.boost_slider, self.boost_spinbox, 100,
+                                  self._emit_parameters_throttled)
         
     def _setup_kernel_size_control(self) -> None:
         """Set up kernel size control for custom kernels."""
@@ -156,6 +103,7 @@ class HighpassView(BaseProcessorView):
         kernel_layout.addWidget(kernel_label)
         
         self.kernel_spinbox = QSpinBox()
+        self.kernel_spinbox.setKeyboardTracking(False)
         self.kernel_spinbox.setMinimum(3)
         self.kernel_spinbox.setMaximum(5)
         self.kernel_spinbox.setSingleStep(2)
@@ -163,18 +111,17 @@ class HighpassView(BaseProcessorView):
         self.kernel_spinbox.setSuffix(" x 3" if self.kernel_spinbox.value() == 3 else " x 5")
         
         kernel_layout.addWidget(self.kernel_spinbox)
-        self.layout.addWidget(self.kernel_container)
+        # Sits directly above the options
+        index = self.layout.indexOf(self.options_container)
+        self.layout.insertWidget(index, self.kernel_container)
         
         # Connect kernel control
         self.kernel_spinbox.valueChanged.connect(self._on_kernel_size_changed)
         
-        # Initially hide kernel size (only shown for custom filter)
-        self.kernel_container.setVisible(False)
-        
     def _setup_options(self) -> None:
         """Set up additional options."""
-        options_container = QWidget()
-        options_layout = QVBoxLayout(options_container)
+        self.options_container = QWidget()
+        options_layout = QVBoxLayout(self.options_container)
         
         options_label = QLabel("Options:")
         options_layout.addWidget(options_label)
@@ -184,67 +131,36 @@ class HighpassView(BaseProcessorView):
         self.preserve_brightness_checkbox.setChecked(True)
         options_layout.addWidget(self.preserve_brightness_checkbox)
         
-        self.layout.addWidget(options_container)
+        self.layout.addWidget(self.options_container)
         
         # Connect options
         self.preserve_brightness_checkbox.stateChanged.connect(self._on_parameters_changed)
         
     def _on_filter_type_changed(self, filter_type: str) -> None:
         """Handle filter type selection changes."""
-        # Show/hide relevant controls based on filter type
-        if filter_type in ["Unsharp Mask", "High Boost"]:
-            self.gaussian_container.setVisible(True)
-        else:
-            self.gaussian_container.setVisible(False)
-            
-        if filter_type == "High Boost":
-            self.boost_container.setVisible(True)
-        else:
-            self.boost_container.setVisible(False)
-            
-        if filter_type == "Custom Kernel":
-            self.kernel_container.setVisible(True)
-        else:
-            self.kernel_container.setVisible(False)
+        if filter_type == self._last_filter_type:
+            return
+        self._last_filter_type = filter_type
+        
+        # Show/hide relevant controls based on filter type, repainting once
+        # after all of them change
+        self.setUpdatesEnabled(False)
+        try:
+            if filter_type == "High Boost" and self.boost_container is None:
+                self._setup_boost_factor_control()
+            if filter_type == "Custom Kernel" and self.kernel_container is None:
+                self._setup_kernel_size_control()
+                
+            self.gaussian_container.setVisible(filter_type in ["Unsharp Mask", "High Boost"])
+            if self.boost_container is not None:
+                self.boost_container.setVisible(filter_type == "High Boost")
+            if self.kernel_container is not None:
+                self.kernel_container.setVisible(filter_type == "Custom Kernel")
+        finally:
+            self.setUpdatesEnabled(True)
             
         self._on_parameters_changed()
         
-    def _on_strength_slider_changed(self, value: int) -> None:
-        """Handle strength slider changes."""
-        strength_value = value / 100.0  # Convert to 0.0-5.0 range
-        self.strength_spinbox.setValue(strength_value)
-        self._on_parameters_changed()
-        
-    def _on_strength_spinbox_changed(self, value: float) -> None:
-        """Handle strength spinbox changes."""
-        slider_value = int(value * 100)  # Convert to 0-500 range
-        self.strength_slider.setValue(slider_value)
-        self._on_parameters_changed()
-        
-    def _on_gaussian_slider_changed(self, value: int) -> None:
-        """Handle gaussian slider changes."""
-        gaussian_value = value / 100.0  # Convert to 0.1-10.0 range
-        self.gaussian_spinbox.setValue(gaussian_value)
-        self._on_parameters_changed()
-        
-    def _on_gaussian_spinbox_changed(self, value: float) -> None:
-        """Handle gaussian spinbox changes."""
-        slider_value = int(value * 100)  # Convert to 10-1000 range
-        self.gaussian_slider.setValue(slider_value)
-        self._on_parameters_changed()
-        
-    def _on_boost_slider_changed(self, value: int) -> None:
-        """Handle boost factor slider changes."""
-        boost_value = value / 100.0  # Convert to 1.0-5.0 range
-        self.boost_spinbox.setValue(boost_value)
-        self._on_parameters_changed()
-        
-    def _on_boost_spinbox_changed(self, value: float) -> None:
-        """Handle boost factor spinbox changes."""
-        slider_value = int(value * 100)  # Convert to 100-500 range
-        self.boost_slider.setValue(slider_value)
-        self._on_parameters_changed()
-        
     def _on_kernel_size_changed(self, value: int) -> None:
         """Handle kernel size changes."""
         # Update suffix to show actual kernel dimensions
@@ -260,38 +176,47 @@ class HighpassView(BaseProcessorView):
         """
         Get current parameters from the view.
         
+        The same dictionary is refilled and returned on every call.
+        
         Returns:
             Dict[str, Any]: Current parameter values
         """
-        # Map display names to internal names
-        filter_type_map = {
-            "Unsharp Mask": "unsharp_mask",
-            "Laplacian": "laplacian",
-            "High Boost": "high_boost",
-            "Custom Kernel": "custom"
-        }
-        
-        return {
-            "filter_type": filter_type_map[self.filter_type_combo.currentText()],
-            "strength": self.strength_spinbox.value(),
-            "gaussian_sigma": self.gaussian_spinbox.value(),
-            "boost_factor": self.boost_spinbox.value(),
-            "kernel_size": self.kernel_spinbox.value(),
-            "preserve_brightness": self.preserve_brightness_checkbox.isChecked()
-        }
+        params = self._params
+        params["filter_type"] = self.FILTER_TYPE_MAP[self.filter_type_combo.currentText()]
+        params["strength"] = self.strength_spinbox.value()
+        params["gaussian_sigma"] = self.gaussian_spinbox.value()
+        params["boost_factor"] = (self.boost_spinbox.value() if self.boost_container is not None
+                                  else self.DEFAULT_BOOST_FACTOR)
+        params["kernel_size"] = (self.kernel_spinbox.value() if self.kernel_container is not None
+                                 else self.DEFAULT_KERNEL_SIZE)
+        params["preserve_brightness"] = self.preserve_brightness_checkbox.isChecked()
+        return params
         
     def reset(self) -> None:
         """Reset view to initial state."""
-        # Reset to default values
-        self.filter_type_combo.setCurrentText("Unsharp Mask")
-        self.strength_slider.setValue(100)
-        self.strength_spinbox.setValue(1.0)
-        self.gaussian_slider.setValue(100)
-        self.gaussian_spinbox.setValue(1.0)
-        self.boost_slider.setValue(150)
-        self.boost_spinbox.setValue(1.5)
-        self.kernel_spinbox.setValue(3)
-        self.preserve_brightness_checkbox.setChecked(True)
+        controls = [
+            self.filter_type_combo, self.strength_slider, self.strength_spinbox,
+            self.gaussian_slider, self.gaussian_spinbox, self.preserve_brightness_checkbox
+        ]
+        if self.boost_container is not None:
+            controls += [self.boost_slider, self.boost_spinbox]
+        if self.kernel_container is not None:
+            controls.append(self.kernel_spinbox)
+            
+        # Reset to default values without emitting once per control
+        with self._signals_blocked(*controls):
+            self.filter_type_combo.setCurrentText("Unsharp Mask")
+            self.strength_slider.setValue(100)
+            self.strength_spinbox.setValue(1.0)
+            self.gaussian_slider.setValue(100)
+            self.gaussian_spinbox.setValue(1.0)
+            if self.boost_container is not None:
+                self.boost_slider.setValue(150)
+                self.boost_spinbox.setValue(self.DEFAULT_BOOST_FACTOR)
+            if self.kernel_container is not None:
+                self.kernel_spinbox.setValue(self.DEFAULT_KERNEL_SIZE)
+                self.kernel_spinbox.setSuffix(f" x {self.DEFAULT_KERNEL_SIZE}")
+            self.preserve_brightness_checkbox.setChecked(True)
         
         # Update visibility
         self._on_filter_type_changed("Unsharp Mask")
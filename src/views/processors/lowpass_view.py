@@ -14,6 +14,8 @@ class LowpassView(BaseProcessorView):
     def __init__(self) -> None:
         """Initialize lowpass filter view."""
         super().__init__("Lowpass Filter")
+        # Refilled in place by get_parameters; receivers copy the values out
+        self._params: Dict[str, Any] = {}
         self._setup_lowpass_controls()
         
     def _setup_lowpass_controls(self) -> None:
@@ -38,11 +40,11 @@ class LowpassView(BaseProcessorView):
         layout.addWidget(self.kernel_label)
         
         # Slider
+        # The slider steps through odd sizes only: position n is size 2n + 1
         self.kernel_slider = QSlider(Qt.Orientation.Horizontal)
-        self.kernel_slider.setMinimum(3)
-        self.kernel_slider.setMaximum(15)
-        self.kernel_slider.setValue(3)
-        self.kernel_slider.setSingleStep(2)  # Ensure odd values
+        self.kernel_slider.setMinimum(1)  # 3
+        self.kernel_slider.setMaximum(7)  # 15
+        self.kernel_slider.setValue(1)
         self.kernel_slider.valueChanged.connect(self._on_kernel_size_changed)
         layout.addWidget(self.kernel_slider)
         
@@ -55,48 +57,43 @@ class LowpassView(BaseProcessorView):
         Args:
             filter_type (str): Selected filter type
         """
-        parameters = self.get_parameters()
-        self._emit_parameters(parameters)
+        self._emit_parameters_throttled()
         
     def _on_kernel_size_changed(self, value: int) -> None:
         """
         Handle kernel size slider change.
         
         Args:
-            value (int): New kernel size value
+            value (int): New slider position
         """
-        # Ensure odd values only
-        if value % 2 == 0:
-            value += 1
-            self.kernel_slider.setValue(value)
-            
-        self.kernel_label.setText(f"Kernel Size: {value}")
-        parameters = self.get_parameters()
-        self._emit_parameters(parameters)
+        self.kernel_label.setText(f"Kernel Size: {2 * value + 1}")
+        self._emit_parameters_throttled()
         
     def get_parameters(self) -> Dict[str, Any]:
         """
         Get current parameters from the view.
         
+        The same dictionary is refilled and returned on every call.
+        
         Returns:
             Dict[str, Any]: Current parameter values
         """
-        kernel_size = self.kernel_slider.value()
-        # Ensure odd value
-        if kernel_size % 2 == 0:
-            kernel_size += 1
-            
-        return {
-            "filter_type": self.filter_combo.currentText(),
-            "kernel_size": kernel_size
-        }
+        params = self._params
+        params["filter_type"] = self.filter_combo.currentText()
+        params["kernel_size"] = 2 * self.kernel_slider.value() + 1
+        return params
         
     def reset(self) -> None:
         """Reset view to initial state."""
-        self.filter_combo.setCurrentIndex(0)  # Reset to "gaussian"
-        self.kernel_slider.setValue(3)
+        # Reset to default values without emitting once per control
+        with self._signals_blocked(self.filter_combo, self.kernel_slider):
+            self.filter_combo.setCurrentIndex(0)  # Reset to "gaussian"
+            self.kernel_slider.setValue(1)
         self.kernel_label.setText("Kernel Size: 3")
         
+        # Emit parameters after reset
+        self._emit_parameters(self.get_parameters())
+        
     def set_filter_type(self, filter_type: str) -> None:
         """
         Set the filter type programmatically.
@@ -120,5 +117,5 @@ class LowpassView(BaseProcessorView):
         if kernel_size % 2 == 0:
             kernel_size += 1
             
-        self.kernel_slider.setValue(kernel_size)
+        self.kernel_slider.setValue(kernel_size // 2)
         self.kernel_label.setText(f"Kernel Size: {kernel_size}") 
\ No newline at end of file
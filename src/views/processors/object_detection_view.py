@@ -1,7 +1,6 @@
 from typing import Dict, Any
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                            QSlider, QSpinBox, QCheckBox, QDoubleSpinBox)
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                            QCheckBox, QDoubleSpinBox)
 from views.processors.base_processor_view import BaseProcessorView
 
 class ObjectDetectionView(BaseProcessorView):
@@ -15,6 +14,8 @@ class ObjectDetectionView(BaseProcessorView):
     def __init__(self) -> None:
         """Initialize the object detection view."""
         super().__init__("Object Detection")
+        # Refilled in place by get_parameters; receivers copy the values out
+        self._params: Dict[str, Any] = {}
         self._setup_controls()
         
     def _setup_controls(self) -> None:
@@ -26,60 +27,12 @@ class ObjectDetectionView(BaseProcessorView):
         
     def _setup_threshold_controls(self) -> None:
         """Set up Canny threshold controls."""
-        # Threshold 1 control
-        threshold1_container = QWidget()
-        threshold1_layout = QVBoxLayout(threshold1_container)
-        
-        threshold1_label = QLabel("Canny Threshold 1:")
-        threshold1_layout.addWidget(threshold1_label)
-        
-        threshold1_slider_layout = QHBoxLayout()
-        
-        self.threshold1_slider = QSlider(Qt.Orientation.Horizontal)
-        self.threshold1_slider.setMinimum(1)
-        self.threshold1_slider.setMaximum(255)
-        self.threshold1_slider.setValue(30)
-        self.threshold1_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
-        self.threshold1_slider.setTickInterval(50)
-        
-        self.threshold1_spinbox = QSpinBox()
-        self.threshold1_spinbox.setMinimum(1)
-        self.threshold1_spinbox.setMaximum(255)
-        self.threshold1_spinbox.setValue(30)
-        self.threshold1_spinbox.setFixedWidth(60)
-        
-        threshold1_slider_layout.addWidget(self.threshold1_slider)
-        threshold1_slider_layout.addWidget(self.threshold1_spinbox)
-        threshold1_layout.addLayout(threshold1_slider_layout)
-        
+        threshold1_container, self.threshold1_slider, self.threshold1_spinbox = self._create_linked_int_slider(
+            "Canny Threshold 1:", (1, 255), 30, (1, 255), 30, tick_interval=50)
         self.layout.addWidget(threshold1_container)
         
-        # Threshold 2 control
-        threshold2_container = QWidget()
-        threshold2_layout = QVBoxLayout(threshold2_container)
-        
-        threshold2_label = QLabel("Canny Threshold 2:")
-        threshold2_layout.addWidget(threshold2_label)
-        
-        threshold2_slider_layout = QHBoxLayout()
-        
-        self.threshold2_slider = QSlider(Qt.Orientation.Horizontal)
-        self.threshold2_slider.setMinimum(1)
-        self.threshold2_slider.setMaximum(255)
-        self.threshold2_slider.setValue(150)
-        self.threshold2_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
-        self.threshold2_slider.setTickInterval(50)
-        
-        self.threshold2_spinbox = QSpinBox()
-        self.threshold2_spinbox.setMinimum(1)
-        self.threshold2_spinbox.setMaximum(255)
-        self.threshold2_spinbox.setValue(150)
-        self.threshold2_spinbox.setFixedWidth(60)
-        
-        threshold2_slider_layout.addWidget(self.threshold2_slider)
-        threshold2_slider_layout.addWidget(self.threshold2_spinbox)
-        threshold2_layout.addLayout(threshold2_slider_layout)
-        
+        threshold2_container, self.threshold2_slider, self.threshold2_spinbox = self._create_linked_int_slider(
+            "Canny Threshold 2:", (1, 255), 150, (1, 255), 150, tick_interval=50)
         self.layout.addWidget(threshold2_container)
         
         # Connect threshold controls
@@ -90,37 +43,15 @@ class ObjectDetectionView(BaseProcessorView):
         
     def _setup_gaussian_control(self) -> None:
         """Set up Gaussian kernel size control."""
-        gaussian_container = QWidget()
-        gaussian_layout = QVBoxLayout(gaussian_container)
-        
-        gaussian_label = QLabel("Gaussian Kernel Size:")
-        gaussian_layout.addWidget(gaussian_label)
-        
-        gaussian_slider_layout = QHBoxLayout()
-        
-        self.gaussian_slider = QSlider(Qt.Orientation.Horizontal)
-        self.gaussian_slider.setMinimum(1)
-        self.gaussian_slider.setMaximum(15)
-        self.gaussian_slider.setValue(5)
-        self.gaussian_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
-        self.gaussian_slider.setTickInterval(2)
-        
-        self.gaussian_spinbox = QSpinBox()
-        self.gaussian_spinbox.setMinimum(1)
-        self.gaussian_spinbox.setMaximum(15)
-        self.gaussian_spinbox.setSingleStep(2)
-        self.gaussian_spinbox.setValue(5)
-        self.gaussian_spinbox.setFixedWidth(60)
-        
-        gaussian_slider_layout.addWidget(self.gaussian_slider)
-        gaussian_slider_layout.addWidget(self.gaussian_spinbox)
-        gaussian_layout.addLayout(gaussian_slider_layout)
-        
+        # The slider steps through odd sizes only: position n is size 2n + 1,
+        # so positions 0-7 cover sizes 1-15 with a default of 5
+        gaussian_container, self.gaussian_slider, self.gaussian_spinbox = self._create_linked_int_slider(
+            "Gaussian Kernel Size:", (0, 7), 2, (1, 15), 5, tick_interval=1, single_step=2)
         self.layout.addWidget(gaussian_container)
         
         # Connect gaussian control
-        self.gaussian_slider.valueChanged.connect(self._on_gaussian_changed)
-        self.gaussian_spinbox.valueChanged.connect(self._on_gaussian_changed)
+        self.gaussian_slider.valueChanged.connect(self._on_gaussian_slider_changed)
+        self.gaussian_spinbox.valueChanged.connect(self._on_gaussian_spinbox_changed)
         
     def _setup_area_control(self) -> None:
         """Set up minimum contour area control."""
@@ -133,6 +64,7 @@ class ObjectDetectionView(BaseProcessorView):
         area_input_layout = QHBoxLayout()
         
         self.area_spinbox = QDoubleSpinBox()
+        self.area_spinbox.setKeyboardTracking(False)
         self.area_spinbox.setMinimum(0.0)
         self.area_spinbox.setMaximum(10000.0)
         self.area_spinbox.setValue(100.0)
@@ -145,8 +77,9 @@ class ObjectDetectionView(BaseProcessorView):
         
         self.layout.addWidget(area_container)
         
-        # Connect area control
-        self.area_spinbox.valueChanged.connect(self._on_parameters_changed)
+        # Connect area control; with keyboard tracking off, typed values arrive
+        # once on Enter/focus-out, and held arrow keys are throttled
+        self.area_spinbox.valueChanged.connect(self._on_area_changed)
         
     def _setup_display_options(self) -> None:
         """Set up display option checkboxes."""
@@ -174,41 +107,38 @@ class ObjectDetectionView(BaseProcessorView):
         
     def _on_threshold1_changed(self, value: int) -> None:
         """Handle threshold1 value changes."""
-        # Ensure odd values for kernel size
-        if hasattr(self, 'gaussian_slider') and value % 2 == 0:
-            value = value + 1 if value < 255 else value - 1
-            
-        # Sync slider and spinbox
-        if self.sender() == self.threshold1_slider:
-            self.threshold1_spinbox.setValue(value)
-        else:
-            self.threshold1_slider.setValue(value)
+        # Keep both widgets on the same value
+        self._sync_peer(self.threshold1_slider, value)
+        self._sync_peer(self.threshold1_spinbox, value)
             
-        self._on_parameters_changed()
+        self._emit_parameters_throttled()
         
     def _on_threshold2_changed(self, value: int) -> None:
         """Handle threshold2 value changes."""
-        # Sync slider and spinbox
-        if self.sender() == self.threshold2_slider:
-            self.threshold2_spinbox.setValue(value)
-        else:
-            self.threshold2_slider.setValue(value)
+        # Keep both widgets on the same value
+        self._sync_peer(self.threshold2_slider, value)
+        self._sync_peer(self.threshold2_spinbox, value)
             
-        self._on_parameters_changed()
+        self._emit_parameters_throttled()
+        
+    def _on_gaussian_slider_changed(self, value: int) -> None:
+        """Handle Gaussian kernel slider changes."""
+        self._sync_peer(self.gaussian_spinbox, 2 * value + 1)
+        self._emit_parameters_throttled()
         
-    def _on_gaussian_changed(self, value: int) -> None:
-        """Handle Gaussian kernel size changes."""
-        # Ensure odd values for kernel size
+    def _on_gaussian_spinbox_changed(self, value: int) -> None:
+        """Handle Gaussian kernel spinbox changes."""
+        # Typed sizes may be even; snap them to the nearest valid odd size
         if value % 2 == 0:
             value = value + 1 if value < 15 else value - 1
+            self._sync_peer(self.gaussian_spinbox, value)
             
-        # Sync slider and spinbox
-        if self.sender() == self.gaussian_slider:
-            self.gaussian_spinbox.setValue(value)
-        else:
-            self.gaussian_slider.setValue(value)
-            
-        self._on_parameters_changed()
+        self._sync_peer(self.gaussian_slider, value // 2)
+        self._emit_parameters_throttled()
+        
+    def _on_area_changed(self, value: float) -> None:
+        """Handle minimum contour area changes."""
+        self._emit_parameters_throttled()
         
     def _on_parameters_changed(self) -> None:
         """Handle any parameter change."""
@@ -219,30 +149,38 @@ class ObjectDetectionView(BaseProcessorView):
         """
         Get current parameters from the view.
         
+        The same dictionary is refilled and returned on every call.
+        
         Returns:
             Dict[str, Any]: Current parameter values
         """
-        return {
-            "threshold1": self.threshold1_spinbox.value(),
-            "threshold2": self.threshold2_spinbox.value(),
-            "gaussian_kernel": self.gaussian_spinbox.value(),
-            "min_contour_area": self.area_spinbox.value(),
-            "show_numbering": self.show_numbering_checkbox.isChecked(),
-            "show_area": self.show_area_checkbox.isChecked()
-        }
+        params = self._params
+        params["threshold1"] = self.threshold1_spinbox.value()
+        params["threshold2"] = self.threshold2_spinbox.value()
+        params["gaussian_kernel"] = self.gaussian_spinbox.value()
+        params["min_contour_area"] = self.area_spinbox.value()
+        params["show_numbering"] = self.show_numbering_checkbox.isChecked()
+        params["show_area"] = self.show_area_checkbox.isChecked()
+        return params
         
     def reset(self) -> None:
         """Reset view to initial state."""
-        # Reset to default values
-        self.threshold1_slider.setValue(30)
-        self.threshold1_spinbox.setValue(30)
-        self.threshold2_slider.setValue(150)
-        self.threshold2_spinbox.setValue(150)
-        self.gaussian_slider.setValue(5)
-        self.gaussian_spinbox.setValue(5)
-        self.area_spinbox.setValue(100.0)
-        self.show_numbering_checkbox.setChecked(True)
-        self.show_area_checkbox.setChecked(True)
+        # Reset to default values without emitting once per control
+        with self._signals_blocked(
+            self.threshold1_slider, self.threshold1_spinbox,
+            self.threshold2_slider, self.threshold2_spinbox,
+            self.gaussian_slider, self.gaussian_spinbox, self.area_spinbox,
+            self.show_numbering_checkbox, self.show_area_checkbox
+        ):
+            self.threshold1_slider.setValue(30)
+            self.threshold1_spinbox.setValue(30)
+            self.threshold2_slider.setValue(150)
+            self.threshold2_spinbox.setValue(150)
+            self.gaussian_slider.setValue(2)
+            self.gaussian_spinbox.setValue(5)
+            self.area_spinbox.setValue(100.0)
+            self.show_numbering_checkbox.setChecked(True)
+            self.show_area_checkbox.setChecked(True)
         
         # Emit parameters after reset
         self._on_parameters_changed() 
\ No newline at end of file
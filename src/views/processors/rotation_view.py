@@ -1,13 +1,23 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSpinBox, QComboBox
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt
 from .base_processor_view import BaseProcessorView
 from ..components.base_input import SpinBoxInput
 
 class RotationView(BaseProcessorView):
-    rotation_type_changed = pyqtSignal(str)  # Keep this signal for controller compatibility
+    # Map display names to internal parameter names
+    ROTATION_TYPE_MAP = {
+        "Center": "center",
+        "Origin": "origin"
+    }
+    ROTATION_TYPE_VALUES = tuple(ROTATION_TYPE_MAP.values())
+    
+    DEGREE_LABEL = "Degree:"
+    ROTATION_TYPE_LABEL = "Rotation Type:"
     
     def __init__(self):
         super().__init__("Rotation")
+        # Refilled in place by get_parameters; receivers copy the values out
+        self._params = {}
         self._setup_rotation_ui()
         
     def _setup_rotation_ui(self):
@@ -16,51 +26,53 @@ class RotationView(BaseProcessorView):
         
         # Degree input
         degree_container = self._create_vertical_layout()
-        degree_label = QLabel("Degree:")
+        degree_label = QLabel(self.DEGREE_LABEL)
         self.degree_input = QSpinBox()
+        self.degree_input.setKeyboardTracking(False)
         self.degree_input.setRange(-360, 360)  # Allow negative values for counter-clockwise
         self.degree_input.setValue(0)
-        self.degree_input.valueChanged.connect(self._on_parameter_changed)
+        self.degree_input.valueChanged.connect(self._on_degree_changed)
         degree_container.addWidget(degree_label)
         degree_container.addWidget(self.degree_input)
         input_layout.addWidget(degree_container.parent())
         
         # Rotation type selection
-        self.rotation_type = self._create_combobox("Rotation Type:", ["Center", "Origin"])
+        self.rotation_type = self._create_combobox(self.ROTATION_TYPE_LABEL, list(self.ROTATION_TYPE_MAP))
         self.rotation_type.currentIndexChanged.connect(self._on_rotation_type_changed)
         
-    def _on_rotation_type_changed(self, index: int):
-        rotation_type = "center" if index == 0 else "origin"
-        self.rotation_type_changed.emit(rotation_type)
-        self._on_parameter_changed()
+    def _on_degree_changed(self, value: int):
+        # Holding an arrow key repeats quickly; throttle like a slider drag
+        self._emit_parameters_throttled()
         
-    def _on_parameter_changed(self):
-        parameters = self.get_parameters()
-        self._emit_parameters(parameters)
+    def _on_rotation_type_changed(self, index: int):
+        # The rotation type travels in the parameters with the degree, so one
+        # emission updates both; sharing the degree throttle reports a type
+        # switch made while the degree is still changing together with it
+        self._emit_parameters_throttled()
         
     def get_parameters(self) -> dict:
-        return {
-            "degree": self.degree_input.value(),
-            "rotation_type": "center" if self.rotation_type.currentIndex() == 0 else "origin"
-        }
+        params = self._params
+        # Rotation is periodic, so e.g. -270, 90 and 450 are reported as the
+        # same 90 and the repeat is dropped as unchanged
+        params["degree"] = self.degree_input.value() % 360
+        params["rotation_type"] = self.ROTATION_TYPE_VALUES[self.rotation_type.currentIndex()]
+        return params
         
     def reset(self):
-        self.degree_input.setValue(0)
-        self.rotation_type.setCurrentIndex(0)
+        # Reset to default values without emitting once per control
+        with self._signals_blocked(self.degree_input, self.rotation_type):
+            self.degree_input.setValue(0)
+            self.rotation_type.setCurrentIndex(0)
+        
+        # Emit parameters after reset
+        self._emit_parameters(self.get_parameters())
         
     def cleanup(self):
-        if hasattr(self, 'degree_input'):
-            try:
-                self.degree_input.valueChanged.disconnect()
-            except:
-                pass
-        if hasattr(self, 'rotation_type'):
-            try:
-                self.rotation_type.currentIndexChanged.disconnect()
-            except:
-                pass
+        # Name each slot so only this view's connections are dropped
         try:
-            self.rotation_type_changed.disconnect()
-        except:
+            self.degree_input.valueChanged.disconnect(self._on_degree_changed)
+            self.rotation_type.currentIndexChanged.disconnect(self._on_rotation_type_changed)
+        except (RuntimeError, TypeError):
+            # Already disconnected by an earlier cleanup
             pass
         super().cleanup() 
\ No newline at end of file
@@ -0,0 +1,13 @@
+"""
+Background workers for view-side image preparation.
+
+Heavy pixel work for display runs on a QThreadPool; only the final
+QPixmap creation, which Qt restricts to the GUI thread, stays on it.
+"""
+
+from .display_conversion_worker import DisplayConversionSignals, DisplayConversionWorker
+
+__all__ = [
+    'DisplayConversionSignals',
+    'DisplayConversionWorker'
+]
@@ -0,0 +1,125 @@
+from typing import Optional, Tuple
+import cv2
+import numpy as np
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+from PyQt6.QtGui import QImage
+from PyQt6 import sip
+from utils.imageScaling_ultil import image_scaling
+
+class DisplayConversionSignals(QObject):
+    """Signals emitted by DisplayConversionWorker."""
+    
+    # (job id, source image, display-resolution copy, converted QImage)
+    finished = pyqtSignal(int, object, object, QImage)
+    # (job id, error message)
+    error = pyqtSignal(int, str)
+
+class DisplayConversionWorker(QRunnable):
+    """
+    Worker that prepares an image for display off the GUI thread.
+    
+    It downsamples the source to the display bound when needed and converts
+    the pixels into a Qt-owned QImage in one of the formats Qt renders
+    fastest. QImage, unlike QPixmap, may be used outside the GUI thread.
+    Images that are not 8-bit (float, 16-bit or boolean results) are
+    stretched to 0-255 first, since the QImage formats below read one byte
+    per channel.
+    """
+    
+    # OpenCV channel layout of uint8 images -> (format wrapping the numpy
+    # buffer, render format)
+    QIMAGE_FORMATS = {
+        1: (QImage.Format.Format_Grayscale8, QImage.Format.Format_RGB32),
+        3: (QImage.Format.Format_BGR888, QImage.Format.Format_RGB32),
+        # BGRA bytes are Format_ARGB32 on little-endian machines
+        4: (QImage.Format.Format_ARGB32, QImage.Format.Format_ARGB32_Premultiplied)
+    }
+    
+    def __init__(self, job_id: int, image: np.ndarray,
+                 display_copy: Optional[np.ndarray], display_bound: int) -> None:
+        """
+        Initialize the worker.
+        
+        Args:
+            job_id (int): Identifier used to discard superseded results
+            image (np.ndarray): Full-resolution BGR source image
+            display_copy (Optional[np.ndarray]): Cached display copy, if any
+            display_bound (int): Longest side the display copy may have
+        """
+        super().__init__()
+        self.job_id = job_id
+        self.image = image
+        self.display_copy = display_copy
+        self.display_bound = display_bound
+        self.signals = DisplayConversionSignals()
+    
+    def run(self) -> None:
+        """Build the display copy and QImage and emit them, or emit an error."""
+        try:
+            display_copy, qt_image = self._convert()
+        except Exception as e:
+            self.signals.error.emit(self.job_id, str(e))
+            return
+        self.signals.finished.emit(self.job_id, self.image, display_copy, qt_image)
+    
+    def _convert(self) -> Tuple[np.ndarray, QImage]:
+        """
+        Downsample and convert the image.
+        
+        Returns:
+            Tuple[np.ndarray, QImage]: Display copy and the QImage built from it
+            
+        Raises:
+            ValueError: If the image has a dtype or channel count Qt cannot display
+        """
+        display_copy = self.display_copy
+        if display_copy is None:
+            height, width = self.image.shape[:2]
+            if max(width, height) > self.display_bound:
+                display_copy = image_scaling(self.image, max_width=self.display_bound,
+                                             max_height=self.display_bound)
+            else:
+                display_copy = self.image
+        if display_copy.dtype != np.uint8:
+            display_copy = self._to_uint8(display_copy)
+        
+        height, width = display_copy.shape[:2]
+        channels = display_copy.shape[2] if display_copy.ndim == 3 else 1
+        if channels not in self.QIMAGE_FORMATS:
+            raise ValueError(f"Cannot display an image with {channels} channels")
+        source_format, render_format = self.QIMAGE_FORMATS[channels]
+        # Wrap the pixels in place: the source formats match OpenCV's layouts,
+        # so no cvtColor or tobytes copy is needed. QImage takes the row
+        # stride, so only the pixels within a row must be packed; row-padded
+        # views such as crops are wrapped as they are, anything else (including
+        # flipped views with negative strides) is copied.
+        pixels = display_copy
+        if pixels.strides[0] <= 0 or pixels.strides[1:] != (channels, 1)[:pixels.ndim - 1]:
+            pixels = np.ascontiguousarray(pixels)
+        qt_image = QImage(sip.voidptr(pixels.ctypes.data), width, height,
+                          pixels.strides[0], source_format)
+        # Convert once into Qt's native 32-bit format. The result owns its
+        # memory, so the pixmap never refers to the numpy buffer and painting
+        # needs no further per-pixel conversion.
+        qt_image = qt_image.convertToFormat(render_format)
+        return display_copy, qt_image
+    
+    @staticmethod
+    def _to_uint8(image: np.ndarray) -> np.ndarray:
+        """
+        Stretch an image of any other dtype to the full 8-bit range for display.
+        
+        Args:
+            image (np.ndarray): Float, integer or boolean image
+            
+        Returns:
+            np.ndarray: uint8 image with the same shape
+            
+        Raises:
+            ValueError: If the dtype is not boolean, integer or floating point
+        """
+        if image.dtype.kind not in "biuf":
+            raise ValueError(f"Cannot display an image of type {image.dtype}")
+        if image.dtype == np.bool_:
+            image = image.astype(np.uint8)
+        return cv2.normalize(image, None, 0, 255, cv2.NORM_MINMAX, dtype=cv2.CV_8U)